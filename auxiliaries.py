@@ -4,8 +4,8 @@
 # used in various places throughout the program
 # created to eliminate dependency hell
 
-# used only for primality checks
-from math import sqrt, floor
+# primality and factoring live here
+import numtheory as nt
 
 def numphrase(word: str, number: int):
     """
@@ -45,86 +45,51 @@ def ordinal_suffix(n: int):
 def is_prime(n: int):
     """
     Checks if its input is prime. Auxiliary.
+    See numtheory for the method.
 
     n: int -- The number whose primality is to be checked.
     """
-    if n == 1:
-        return False
-    if n == 2:
-        return True
-    if n % 2 == 0:
-        return False
-    limit = floor(sqrt(n)) + 1
-    # check for divisibility by odd numbers between 3 and sqrt(n)
-    for d in range(3, limit, 2):
-        if n % d == 0:
-            return False
-    return True
+    return nt.is_prime(n)
 
 def prime_factors(n: int):
     """
-    Returns a list of all prime factors of n.
+    Returns a sorted list of all prime factors of n.
     Multiplicities unneeded, thus not returned.
     Auxiliary.
     """
-    if n <= 0:
-        raise ValueError("Attempted to factorize "+
-                         f"nonpositive integer {n}!")
-    if n == 1:
-        return []
-    if is_prime(n):
-        return [n]
-    factors = []
-    p = 2
-    while p * p <= n:
-        # if n is divisible by p, add it to the list
-        # and divide out by it as much as possible
-        if n % p == 0:
-            factors.append(p)
-            while n % p == 0:
-                n //= p
-        # move on to the next prime
-        p += 1
-        while not is_prime(p):
-            p += 1
-    if n > 1:
-        factors.append(n)
-    return factors
+    return list(nt.factorize(n).keys())
 
 def proper_factors(n: int):
     """
-    Returns a sorted list of all factors of a number.
+    Returns a sorted list of all factors of a number,
+    other than 1 and the number itself.
     """
     # edge cases
     if n == 0:
         raise ValueError("Cannot factorize 0.")
     if n < 0:
         return proper_factors(-n)
-    if n == 1 or is_prime(n):
-        return []
+    return nt.divisors(n)[1:-1]
 
-    # do this in O(sqrt(n)) time by only iterating up to that.
-    # all big factors are n // (small factor).
-    small_factors = []
-    big_factors = []
-    root = floor(sqrt(n))
-
-    # iterate up to and INCLUDING root
-    for i in range(2, root+1):
-        if n % i == 0:
-            small_factors.append(i)
-            big_factors.append(n // i)
-            
-    # if n is a perfect square (== root * root),
-    # then root will appear in both big and small factor lists.
-    # it is the largest small factor and the smallest big factor.
-    if root * root == n:
-        del small_factors[-1]
+def mobius(n: int):
+    """
+    The Moebius function: 0 if n has a square factor,
+    otherwise (-1)^(number of prime factors of n). Auxiliary.
+    """
+    exponents = nt.factorize(n).values()
+    if any(e > 1 for e in exponents):
+        return 0
+    return (-1) ** len(exponents)
 
-    big_factors.reverse()
-    factors = small_factors + big_factors
-    return factors
-    
+def euler_phi(n: int):
+    """
+    Euler's totient: the count of 1 <= k <= n coprime to n.
+    Auxiliary.
+    """
+    result = n
+    for p in prime_factors(n):
+        result = result // p * (p - 1)
+    return result
 
 def parse_lincomb(arguments: list):
     """
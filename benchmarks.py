@@ -0,0 +1,236 @@
+# benchmarks module
+
+# timing comparisons for the performance-sensitive parts of the program
+# not used by main; run directly:
+#   python benchmarks.py            -- runs every benchmark
+#   python benchmarks.py <name>     -- runs only the named one(s)
+
+import io
+import random
+import sys
+import time
+import tracemalloc
+from contextlib import redirect_stdout
+
+import polynomial as pol
+import pprops
+import nonprimefield as npf
+
+def timed(func, *args, repeat: int = 1):
+    """
+    Runs func(*args) `repeat` times and returns
+    the best wall-clock time of a single run, in seconds.
+    """
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+def random_coeffs(length: int):
+    """
+    A list of `length` random coefficients in 0..FCH-1.
+    """
+    return [random.randrange(pol.FCH) for _ in range(length)]
+
+def bench_mul():
+    """
+    Multiplication backends: the original schoolbook convolution loop
+    against Karatsuba/Toom-3, Kronecker substitution and the NTT.
+    """
+    print(f"Multiplication over F_{pol.FCH}, "
+          "random operands of equal length (seconds):")
+    print(f"{'length':>8} {'schoolbook':>11} {'split':>11} "
+          f"{'kronecker':>11} {'ntt':>11}")
+    for length in [250, 1000, 4000, 16000, 64000]:
+        a = random_coeffs(length)
+        b = random_coeffs(length)
+        # the quadratic loop gets too slow to be worth waiting for
+        if length <= 4000:
+            school = f"{timed(pol.mul_schoolbook, a, b):11.4f}"
+        else:
+            school = f"{'-':>11}"
+        if length <= 16000:
+            split = f"{timed(pol.mul_coeffs, a, b):11.4f}"
+        else:
+            split = f"{'-':>11}"
+        kron = timed(pol.mul_kronecker, a, b, repeat=3)
+        ntt = timed(pol.mul_ntt, a, b)
+        print(f"{length:>8} {school} {split} {kron:11.4f} {ntt:11.4f}")
+
+class ListPoly:
+    # stand-in for the old Poly layout:
+    # an instance __dict__ holding a plain list of ints,
+    # normalized the way the old Poly.normalize did it
+    def __init__(self, cfs: list):
+        self.coeffs = list(map(lambda n: n % pol.FCH, cfs))
+
+def allocated_per_object(factory, coeff_lists: list):
+    """
+    Average number of bytes allocated per object
+    when building one object per coefficient list.
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [factory(cfs) for cfs in coeff_lists]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before) / len(objects)
+
+def bench_memory():
+    """
+    Memory per Poly: list-in-__dict__ layout against
+    the __slots__ + typed array layout.
+    """
+    old_fch = pol.FCH
+    print("Bytes allocated per polynomial:")
+    print(f"{'char':>12} {'degree':>7} {'list+dict':>10} "
+          f"{'slots+array':>12} {'saving':>7}")
+    for fch in [7, 65521, 2 ** 61 - 1]:
+        pol.FCH = fch
+        for degree in [10, 100, 1000]:
+            count = 10000 if degree < 1000 else 1000
+            coeff_lists = [random_coeffs(degree + 1) for _ in range(count)]
+            old = allocated_per_object(ListPoly, coeff_lists)
+            new = allocated_per_object(pol.Poly, coeff_lists)
+            print(f"{fch:>12} {degree:>7} {old:10.0f} {new:12.0f} "
+                  f"{old / new:6.1f}x")
+    pol.FCH = old_fch
+
+def random_square_free(degree: int):
+    """
+    A random monic square-free polynomial of the given degree.
+    """
+    while True:
+        f = pol.Poly(random_coeffs(degree) + [1])
+        if pol.poly_gcd(f, f.deriv()).degree() == 0:
+            return f
+
+def cantor_zassenhaus(f):
+    # the randomized pipeline factorize uses above the Berlekamp limits
+    return [factor for g, d in pprops.distinct_degree_factorization(f)
+            for factor in pprops.equal_degree_factorization(g, d)]
+
+def bench_factor():
+    """
+    Factoring square-free polynomials: Berlekamp's algorithm
+    against distinct-degree + Cantor-Zassenhaus, to locate
+    the crossover used by factorize (BERLEKAMP_MAX_CHAR/DEGREE).
+    """
+    old_fch = pol.FCH
+    print("Factoring random square-free polynomials (seconds):")
+    print(f"{'char':>5} {'degree':>7} {'berlekamp':>10} {'ddf+cz':>10}")
+    for fch in [2, 3, 7, 31]:
+        pol.FCH = fch
+        for degree in [10, 20, 30, 40, 50, 100, 200]:
+            f = random_square_free(degree)
+            berl = timed(pprops.berlekamp_factorization, f, repeat=3)
+            cz = timed(cantor_zassenhaus, f, repeat=3)
+            print(f"{fch:>5} {degree:>7} {berl:10.4f} {cz:10.4f}")
+    pol.FCH = old_fch
+
+def multiply_pairs(pairs: list):
+    for a, b in pairs:
+        a * b
+
+def multiply_pairs_scanning(pairs: list):
+    # the old FieldEl lookup: every product's logarithm
+    # found by a linear scan of the power table
+    for a, b in pairs:
+        npf.FieldEl.powers.index((a * b).code)
+
+def bench_fieldmul():
+    """
+    Multiplication throughput in GF(3^10): logarithms looked up
+    by scanning the power table, as FieldEl used to,
+    against indexing the array log table built by setfield.
+    """
+    old_fch = pol.FCH
+    pol.FCH = 3
+    quotpoly = pprops.find_primitive(10, "lexfirst")
+    # setfield reports its progress; keep the table clean
+    with redirect_stdout(io.StringIO()):
+        npf.FieldEl.setfield(quotpoly)
+    elements = []
+    while len(elements) < 2000:
+        el = npf.FieldEl(random_coeffs(10))
+        if el.dlog is not None:
+            elements.append(el)
+    pairs = list(zip(elements[::2], elements[1::2]))
+    print(f"Multiplication in GF(3^10) = F_3[x]/({quotpoly}):")
+    print(f"{'lookup':>10} {'products':>9} {'seconds':>9} {'per second':>11}")
+    for name, func, count in [("scan", multiply_pairs_scanning, 50),
+                              ("log table", multiply_pairs, 1000)]:
+        seconds = timed(func, pairs[:count], repeat=3)
+        print(f"{name:>10} {count:>9} {seconds:9.4f} "
+              f"{count / seconds:11.0f}")
+    pol.FCH = old_fch
+
+def add_pairs(pairs: list):
+    for a, b in pairs:
+        a + b
+        a - b
+
+def bench_fieldadd():
+    """
+    Addition and subtraction throughput in GF(3^10):
+    decoding to polynomials, adding and encoding the sum again,
+    against Zech's logarithms from the array tables.
+    """
+    old_fch = pol.FCH
+    pol.FCH = 3
+    quotpoly = pprops.find_primitive(10, "lexfirst")
+    print(f"Addition and subtraction in GF(3^10) = F_3[x]/({quotpoly}):")
+    print(f"{'method':>10} {'pairs':>9} {'seconds':>9} {'per second':>11}")
+    for name, zech in [("poly", False), ("zech", True)]:
+        with redirect_stdout(io.StringIO()):
+            npf.FieldEl.setfield(quotpoly, zech)
+        elements = [npf.FieldEl(random_coeffs(10)) for _ in range(20000)]
+        pairs = list(zip(elements[::2], elements[1::2]))
+        seconds = timed(add_pairs, pairs, repeat=3)
+        print(f"{name:>10} {len(pairs):>9} {seconds:9.4f} "
+              f"{len(pairs) / seconds:11.0f}")
+    pol.FCH = old_fch
+
+def bench_fieldmem():
+    """
+    Size and build time of the lookup tables made by setfield.
+    Timed and measured in separate runs, tracemalloc being slow.
+    """
+    old_fch = pol.FCH
+    print("Field lookup tables built by setfield:")
+    print(f"{'field':>10} {'elements':>9} {'seconds':>9} "
+          f"{'MB':>8} {'bytes/el':>9}")
+    for p, n in [(2, 16), (3, 10), (7, 7), (251, 2)]:
+        pol.FCH = p
+        quotpoly = pprops.find_primitive(n, "lexfirst")
+        with redirect_stdout(io.StringIO()):
+            seconds = timed(npf.FieldEl.setfield, quotpoly)
+            # drop the tables before measuring them
+            npf.FieldEl.reset()
+            tracemalloc.start()
+            npf.FieldEl.setfield(quotpoly)
+            size = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+        print(f"{f'GF({p}^{n})':>10} {p ** n:>9} {seconds:9.2f} "
+              f"{size / 2**20:8.1f} {size / p ** n:9.1f}")
+    pol.FCH = old_fch
+
+benchmarks = {"mul": bench_mul, "memory": bench_memory,
+              "factor": bench_factor, "fieldmul": bench_fieldmul,
+              "fieldadd": bench_fieldadd, "fieldmem": bench_fieldmem}
+
+if __name__ == "__main__":
+    random.seed(0)
+    names = sys.argv[1:] or list(benchmarks.keys())
+    for name in names:
+        if name not in benchmarks:
+            print(f"Unknown benchmark {name}! "
+                  "Available: " + ", ".join(benchmarks.keys()))
+            continue
+        print(f"--{name}--")
+        benchmarks[name]()
+        print()
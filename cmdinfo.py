@@ -46,7 +46,9 @@ cmds_list["setfield"] = ("Usage: setfield <name> [CONFIRM]\n\n"
                          "elements, but polynomials are kept intact."
                          "Requires confirmation in the form of 'CONFIRM' "
                          "(all caps, no quotes) as second argument, "
-                         "unless the field is uninitialized.")                       
+                         "unless the field is uninitialized.\n"
+                         "Fields too large for lookup tables are set up "
+                         "table-free, where `dlog` is unavailable.")                       
 cmds_list["field"] = ("Usage: field\n\n"
                       "Displays the polynomial used to define the current "
                       "non-prime field GF(p^n).")
@@ -190,9 +192,14 @@ cmds_list["eucdiv"] = ("Usage: eucdiv <dividend> <divisor> <quot> <rem>\n\n"
                        "Performs Euclidean division on polynomials "
                        "`dividend` and `divisor`, and stores the results "
                        "(quotient and remainder) under their indicated names.")
-cmds_list["eval"] = ("Usage: eval <name> <point>\n\n"
+cmds_list["eval"] = ("Usage: eval <name> <point1> [<point2> ...]\n\n"
                      "Evaluates the polynomial by name `name` at x = `point` "
-                     "and prints the value on the screen.")
+                     "and prints the value on the screen.\n"
+                     "Several points are evaluated all at once.")
+cmds_list["evalall"] = ("Usage: evalall <name>\n\n"
+                        "Evaluates the polynomial by name `name` at every "
+                        "element of the base field F_p and prints "
+                        "the values on the screen.")
 cmds_list["modulo"] = ("Usage: modulo <name> <modulus> <result>\n\n"
                        "Reduces polynomial `name` modulo polynomial "
                        "`modulus` and stores the result in `result` "
@@ -214,6 +221,15 @@ cmds_list["diff"] = ("Usage: diff <name> <result> OR "
                      "(which must not exist).\n"
                      "With `order` not specified, differentiates once "
                      "(i.e. takes the 1st derivative).")
+cmds_list["interp"] = ("Usage: interp <result> <x1> <y1> [<x2> <y2> ...] "
+                       "OR interp <result> file <filename>\n\n"
+                       "Finds the polynomial of least degree taking "
+                       "value y1 at x1, y2 at x2, and so on, and "
+                       "stores it in `result`. The points must be "
+                       "distinct modulo the characteristic.\n"
+                       "With `file`, reads the pairs from file "
+                       "\\saves\\<filename> instead, one `x y` pair "
+                       "per line; lines starting with # are skipped.")
 # property commands
 cmds_list["degree"] = ("Usage: degree <name>\n\n"
                        "Prints the degree of the polynomial `name` on "
@@ -226,7 +242,9 @@ cmds_list["dlog"] = ("Usage: dlog <name>\n\n"
                      "`name` on the screen.\nThe discrete logarithm "
                      "of a nonzero field element `e` of GF(p^n) "
                      "is the unique exponent k between 0 and p^n - 2 "
-                     "such that a^k == e.")
+                     "such that a^k == e.\n"
+                     "Needs the field's lookup tables, so it does not "
+                     "work in table-free fields.")
 cmds_list["coeff"] = ("Usage: coeff <name> <power>\n\n"
                       "Prints a single coefficient of the specified "
                       "polynomial. If requested power is higher than "
@@ -236,10 +254,13 @@ cmds_list["order"] = ("Usage: order <name>\n\n"
                       "the multiplicative group of GF(p^n).\nThe "
                       "order of an element `e` is the lowest "
                       "exponent n such that e^n = 1.")
-cmds_list["irred"] = ("Usage: irred <name> [reason]\n\n"
+cmds_list["irred"] = ("Usage: irred <name> [benor] [reason]\n\n"
                       "Checks if polynomial `name` is irreducible, "
                       "and prints the result on the screen.\n"
-                      "If second argument is `reason`, also prints "
+                      "With `benor`, uses Ben-Or's test instead of "
+                      "Rabin's: faster on polynomials with a factor "
+                      "of small degree, slower on irreducible ones.\n"
+                      "With `reason`, also prints "
                       "the reason for (ir)reducibility as detected "
                       "by the irreducibility checker.")
 cmds_list["prim"] = ("Usage: prim <name>\n\n"
@@ -247,6 +268,49 @@ cmds_list["prim"] = ("Usage: prim <name>\n\n"
                      "Note: polynomials that are not irreducible, "
                      "as well as those of degree 1 or under, "
                      "are not considered primitive.")
+cmds_list["factor"] = ("Usage: factor <name>\n\n"
+                       "Factorizes polynomial `name` into monic "
+                       "irreducible factors and prints the "
+                       "factorization on the screen.")
+cmds_list["genirred"] = ("Usage: genirred <degree> [limit]\n\n"
+                         "Prints every monic irreducible polynomial "
+                         "of the given degree, as they are found, "
+                         "numbered against the expected total "
+                         "from Gauss's formula.\n"
+                         "If `limit` is given, stops after that many.")
+cmds_list["genprim"] = ("Usage: genprim <degree> [limit]\n\n"
+                        "Same as `genirred`, but for monic "
+                        "primitive polynomials.")
+cmds_list["findprim"] = ("Usage: findprim <degree> [random|lexfirst] "
+                         "[name]\n\n"
+                         "Finds a monic primitive polynomial of the given "
+                         "degree: a random one (the default), or the first "
+                         "one in the order `genprim` lists them in.\n"
+                         "If `name` is given, also stores it as a "
+                         "polynomial under that name, ready for "
+                         "`setfield`.")
+cmds_list["irredall"] = ("Usage: irredall [processes]\n\n"
+                         "Checks every stored polynomial for "
+                         "irreducibility, in parallel, and prints the "
+                         "results in alphabetical order of name.\n"
+                         "Uses one worker process per CPU, or as many "
+                         "as `processes` says; 1 runs the checks "
+                         "without any workers.")
+cmds_list["primall"] = ("Usage: primall [processes]\n\n"
+                        "Same as `irredall`, but checks for "
+                        "primitivity.")
+cmds_list["cache"] = ("Usage: cache OR cache clear OR "
+                      "cache <save|load> <filename>\n\n"
+                      "Irreducibility, primitivity and factorization "
+                      "results are cached, so repeated queries on the "
+                      "same polynomial return at once. So are the "
+                      "integer factorizations of p^n - 1 that "
+                      "primitivity checks need.\n"
+                      "With no input, prints the number of cached "
+                      "results and the hits and misses so far.\n"
+                      "`clear` empties the cache and resets the counters."
+                      "\n`save` and `load` write the cache to, or read it "
+                      "back from, a file in \\saves\\.")
 
 help_pages = [["exit","help","list","setchar","char",
                "setfield","field","displayopts"],
@@ -254,8 +318,11 @@ help_pages = [["exit","help","list","setchar","char",
                "deleteall","update","copy","rename"],
               ["save","load"],
               ["add","subtract","multiply","divide","power",
-               "lincomb","eval","modulo","eucdiv","eea","diff"],
-              ["degree", "dlog", "coeff", "order", "irred", "prim"]]
+               "lincomb","eval","evalall","modulo","eucdiv","eea","diff",
+               "interp"],
+              ["degree", "dlog", "coeff", "order", "irred", "prim",
+               "factor", "genirred", "genprim", "findprim", "irredall",
+               "primall", "cache"]]
 
 special_help_msg = ("Type `list` to see all commands.\n"
                     "Type `help <cmd>` to view the description of one command,"
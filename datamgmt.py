@@ -40,8 +40,7 @@ def set_characteristic(new_char: int):
         # flushing stored objects
         obj_dict.clear()
         # resetting non-prime field
-        npf.FieldEl.quotpoly = None
-        npf.FieldEl.powers = []
+        npf.FieldEl.reset()
 
 def set_field(new_qpoly_name: str):
     """
@@ -405,3 +404,11 @@ def diffmake_poly(name: str, order: int, result: str):
     else:
         poly_diffd = poly.deriv(order)
         obj_dict[result] = poly_diffd
+
+def interpmake_poly(xs: list, ys: list, result: str):
+    """
+    Interpolates the polynomial of least degree
+    taking values `ys` at points `xs`,
+    and stores it under name `result`.
+    """
+    obj_dict[result] = pol.interpolate(xs, ys)
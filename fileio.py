@@ -6,6 +6,8 @@ import os
 import datamgmt as dm
 import polynomial as pol
 import nonprimefield as npf
+import numtheory as nt
+import pprops
 
 def raw_coeffs(obj):
     """
@@ -255,8 +257,7 @@ def load_workspace(filename: str):
     # clear the current workspace
     print(f"File {filename} validated.")
     dm.mass_delete()
-    npf.FieldEl.quotpoly = None
-    npf.FieldEl.powers = []
+    npf.FieldEl.reset()
     print("Previous workspace cleared.")
     # and now we load all the shit in
     # if exceptions happen, they get handled further upstream
@@ -284,4 +285,167 @@ def load_workspace(filename: str):
         elname = parsed[i][1]
         elcoes = [int(coe) for coe in parsed[i][2:]]
         dm.make(elname, elcoes, mode="el")
-        print(f"Field element {elname} loaded.")
\ No newline at end of file
+        print(f"Field element {elname} loaded.")
+
+def read_points(filename: str):
+    """
+    Reads (x, y) pairs from file `filename` for interpolation:
+    one pair per line, as two integers separated by whitespace.
+    Empty lines and lines starting with # are skipped.
+    Returns the lists of x's and y's.
+    """
+    filepath = os.getcwd() + "\\saves\\" + filename
+    # throws error - will be handled upstream in main
+    s = open(filepath, "r")
+    parsed = [line.split() for line in s.readlines()]
+    s.close()
+    xs = []
+    ys = []
+    for i, tokens in enumerate(parsed):
+        if len(tokens) == 0 or tokens[0].startswith("#"):
+            continue
+        if len(tokens) != 2:
+            raise ValueError(f"Line {i+1} of file {filename} should hold "
+                             f"exactly 2 numbers, got {len(tokens)}")
+        try:
+            xs.append(int(tokens[0]))
+            ys.append(int(tokens[1]))
+        except ValueError:
+            raise ValueError(f"Could not parse line {i+1} of file "
+                             f"{filename} as integers!")
+    return xs, ys
+
+# verdict cache files
+# one line per cached verdict, after a "VERDICTS" first line;
+# see fileformat.txt for the layout
+
+def save_verdicts(filename: str):
+    """
+    Saves the contents of pprops.verdict_cache to file `filename`,
+    least recently used first, followed by the integer
+    factorizations in numtheory.factor_cache.
+    """
+    s = open(os.getcwd() + "\\saves\\" + filename, mode="w")
+    s.write("VERDICTS\n")
+    for n, factors in nt.factor_cache.items():
+        s.write(f"INTFACTOR {n} {len(factors)}")
+        for p, e in factors.items():
+            s.write(f" {p} {e}")
+        s.write("\n")
+    for key, value in pprops.verdict_cache.entries.items():
+        kind, fch, coeffs = key
+        poly_tokens = f"{len(coeffs)} " + " ".join(map(str, coeffs))
+        match kind:
+            case "irred" | "benor":
+                s.write(f"{kind.upper()} {fch} {int(value.verdict)} "
+                        f"{poly_tokens} {len(value.polys)}")
+                for poly in value.polys:
+                    s.write(f" {len(poly.coeffs)} {raw_coeffs(poly)}")
+                s.write(f" {value.template}\n")
+            case "prim":
+                s.write(f"PRIM {fch} {int(value)} {poly_tokens}\n")
+            case "factor":
+                s.write(f"FACTOR {fch} {poly_tokens} {value.leadcoe} "
+                        f"{len(value.faclist)}")
+                for factor, mult in value.faclist:
+                    s.write(f" {mult} {len(factor.coeffs)} {raw_coeffs(factor)}")
+                s.write("\n")
+    s.close()
+
+def _take_coeffs(tokens: list, pos: int):
+    # reads "<count> c_0 ... c_(count-1)" starting at tokens[pos];
+    # returns the coefficient tuple and the position after it
+    count = int(tokens[pos])
+    coeffs = tuple(int(c) for c in tokens[pos + 1:pos + 1 + count])
+    if len(coeffs) != count:
+        raise ValueError("too few coefficients")
+    return coeffs, pos + 1 + count
+
+def load_verdicts(filename: str):
+    """
+    Loads verdicts from file `filename` into pprops.verdict_cache,
+    and integer factorizations into numtheory.factor_cache,
+    on top of what they already hold.
+    Returns the number of verdicts and factorizations loaded.
+    """
+    filepath = os.getcwd() + "\\saves\\" + filename
+    # throws error - will be handled upstream in main
+    s = open(filepath, "r")
+    parsed = [line.split() for line in s.readlines()]
+    s.close()
+    if len(parsed) == 0 or parsed[0] != ["VERDICTS"]:
+        raise ValueError(f"File {filename} is not a verdict file -- "
+                         "first line should be \"VERDICTS\"")
+    # parse everything before touching the cache
+    loaded = []
+    for i, tokens in enumerate(parsed[1:], start=2):
+        if len(tokens) == 0 or tokens[0].startswith("#"):
+            continue
+        try:
+            fch = int(tokens[1])
+            match tokens[0]:
+                case "INTFACTOR":
+                    # fch is the factored number here
+                    count = int(tokens[2])
+                    pairs = [int(t) for t in tokens[3:]]
+                    if len(pairs) != 2 * count:
+                        raise ValueError("wrong number of prime factors")
+                    factors = dict(zip(pairs[::2], pairs[1::2]))
+                    product = 1
+                    for p, e in factors.items():
+                        product *= p ** e
+                    if product != fch:
+                        raise ValueError(f"factors do not multiply to {fch}")
+                    loaded.append((("intfactor", fch), factors))
+                case "IRRED" | "BENOR":
+                    coeffs, pos = _take_coeffs(tokens, 3)
+                    count = int(tokens[pos])
+                    pos += 1
+                    polys = []
+                    for _ in range(count):
+                        poly, pos = _take_coeffs(tokens, pos)
+                        polys.append(poly)
+                    value = (tokens[2] == "1", " ".join(tokens[pos:]), polys)
+                    loaded.append(((tokens[0].lower(), fch, coeffs), value))
+                case "PRIM":
+                    coeffs, pos = _take_coeffs(tokens, 3)
+                    loaded.append((("prim", fch, coeffs), tokens[2] == "1"))
+                case "FACTOR":
+                    coeffs, pos = _take_coeffs(tokens, 2)
+                    lead = int(tokens[pos])
+                    count = int(tokens[pos + 1])
+                    pos += 2
+                    faclist = []
+                    for _ in range(count):
+                        mult = int(tokens[pos])
+                        factor, pos = _take_coeffs(tokens, pos + 1)
+                        faclist.append((factor, mult))
+                    loaded.append((("factor", fch, coeffs), (lead, faclist)))
+                case _:
+                    raise ValueError("unknown line header")
+        except (ValueError, IndexError) as e:
+            raise ValueError(f"Could not parse line {i} of file "
+                             f"{filename}: {e}")
+    # the factors and the polynomials in reasons are Polys, which
+    # reduce modulo the current FCH, so build those in their own
+    # characteristic
+    old_fch = pol.FCH
+    try:
+        for key, value in loaded:
+            if key[0] == "intfactor":
+                nt.remember_factorization(key[1], value)
+                continue
+            pol.FCH = key[1]
+            if key[0] == "factor":
+                lead, faclist = value
+                value = pprops.FactorList([(pol.Poly(list(f)), m)
+                                           for f, m in faclist], lead)
+            elif key[0] in ("irred", "benor"):
+                verdict, template, polys = value
+                value = pprops.IrredResult(verdict, template,
+                                           *[pol.Poly(list(f))
+                                             for f in polys])
+            pprops.verdict_cache.put(key, value)
+    finally:
+        pol.FCH = old_fch
+    return len(loaded)
\ No newline at end of file
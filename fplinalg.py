@@ -0,0 +1,101 @@
+# fplinalg module
+
+# contains linear algebra over the prime field F_p,
+# as much of it as the factoring code needs:
+# reduction to row echelon form and null spaces
+
+# matrices are lists of rows; in characteristic 2 each row
+# is packed into one int (bit j holding column j), so that
+# adding rows is a single XOR
+
+def _reduce_rows(rows: list, ncols: int, p: int):
+    """
+    Brings `rows` (lists of ints in 0..p-1) to reduced row echelon form
+    in place. Returns the list of pivot columns, one per nonzero row;
+    the nonzero rows are moved to the front.
+    """
+    pivots = []
+    r = 0
+    for col in range(ncols):
+        if r == len(rows):
+            break
+        # find a row with a nonzero entry in this column
+        for i in range(r, len(rows)):
+            if rows[i][col] != 0:
+                break
+        else:
+            continue
+        rows[r], rows[i] = rows[i], rows[r]
+        inv = pow(rows[r][col], -1, p)
+        pivot_row = [(c * inv) % p for c in rows[r]]
+        rows[r] = pivot_row
+        # clear the column everywhere else
+        for i in range(len(rows)):
+            factor = rows[i][col]
+            if i != r and factor != 0:
+                rows[i] = [(a - factor * b) % p
+                           for a, b in zip(rows[i], pivot_row)]
+        pivots.append(col)
+        r += 1
+    return pivots
+
+def _reduce_rows_gf2(rows: list, ncols: int):
+    """
+    Same as _reduce_rows, for rows packed into ints over F_2.
+    """
+    pivots = []
+    r = 0
+    for col in range(ncols):
+        if r == len(rows):
+            break
+        bit = 1 << col
+        for i in range(r, len(rows)):
+            if rows[i] & bit:
+                break
+        else:
+            continue
+        rows[r], rows[i] = rows[i], rows[r]
+        pivot_row = rows[r]
+        for i in range(len(rows)):
+            if i != r and rows[i] & bit:
+                rows[i] ^= pivot_row
+        pivots.append(col)
+        r += 1
+    return pivots
+
+def pack_row(row):
+    """
+    Packs a row of 0/1 entries into an int, bit j holding entry j.
+    """
+    return sum(1 << j for j, c in enumerate(row) if c)
+
+def nullspace(rows: list, p: int):
+    """
+    Basis of the null space {v : rows * v == 0} of a matrix over F_p,
+    given as a list of rows of equal length.
+    Returns a list of vectors (lists of ints in 0..p-1).
+    """
+    if len(rows) == 0:
+        return []
+    ncols = len(rows[0])
+    if p == 2:
+        packed = [pack_row(row) for row in rows]
+        pivots = _reduce_rows_gf2(packed, ncols)
+        entry = lambda i, j: (packed[i] >> j) & 1
+    else:
+        reduced = [[c % p for c in row] for row in rows]
+        pivots = _reduce_rows(reduced, ncols, p)
+        entry = lambda i, j: reduced[i][j]
+    # every non-pivot column is a free variable: set it to 1,
+    # the other free ones to 0, and solve for the pivot variables
+    basis = []
+    pivot_set = set(pivots)
+    for free in range(ncols):
+        if free in pivot_set:
+            continue
+        vector = [0] * ncols
+        vector[free] = 1
+        for i, col in enumerate(pivots):
+            vector[col] = -entry(i, free) % p
+        basis.append(vector)
+    return basis
@@ -0,0 +1,168 @@
+# gf2poly module
+
+# contains the bit-packed representation of GF(2)[x]
+# a polynomial over GF(2) is stored as a single Python int,
+# with bit i holding the coefficient of x^i
+# so addition is XOR, multiplication by x is a left shift
+# and the degree is bit_length() - 1
+
+# polynomial.py dispatches to these int-level functions
+# in characteristic 2, as do pprops and nonprimefield
+
+from array import array
+
+# coefficient bytes <-> ASCII binary digits
+_TO_ASCII = bytes.maketrans(b"\x00\x01", b"01")
+_FROM_ASCII = bytes.maketrans(b"01", b"\x00\x01")
+
+# operands shorter than this (in bits) are multiplied by the
+# windowed shift-and-XOR loop; longer ones are split Karatsuba-style
+CLMUL_KARATSUBA_BITS = 2048
+
+def from_coeffs(cfs):
+    """
+    Packs a sequence of 0/1 coefficients (ascending order)
+    into an int. Accepts lists, bytes-like objects and
+    'B' arrays, so Poly storage converts without a Python loop.
+    """
+    raw = bytes(cfs)
+    return int(raw[::-1].translate(_TO_ASCII), 2)
+
+def to_coeffs(bits: int):
+    """
+    Unpacks an int into an array('B') of 0/1 coefficients
+    in ascending order, with no leading zeroes.
+    The zero polynomial gives array('B', [0]).
+    """
+    if bits == 0:
+        return array("B", [0])
+    cfs = array("B")
+    # bin() is most significant bit first; [:1:-1] reverses
+    # and drops the "0b" prefix in one go
+    cfs.frombytes(bin(bits)[:1:-1].encode().translate(_FROM_ASCII))
+    return cfs
+
+def degree(bits: int):
+    """
+    Degree of a packed polynomial; -1 for zero, as with Poly.
+    """
+    return bits.bit_length() - 1
+
+def _clmul_windowed(a: int, b: int):
+    """
+    Carry-less product by 4-bit windows of `b`:
+    precomputes a * w for all 16 windows w,
+    then XORs in one shifted table entry per window.
+    """
+    table = [0, a]
+    for w in range(2, 16):
+        if w % 2 == 0:
+            table.append(table[w // 2] << 1)
+        else:
+            table.append(table[w - 1] ^ a)
+    result = 0
+    shift = 0
+    while b:
+        result ^= table[b & 15] << shift
+        b >>= 4
+        shift += 4
+    return result
+
+def clmul(a: int, b: int):
+    """
+    Carry-less multiplication, i.e. the product in GF(2)[x].
+    """
+    if a.bit_length() < b.bit_length():
+        a, b = b, a
+    short = b.bit_length()
+    if short <= CLMUL_KARATSUBA_BITS:
+        return _clmul_windowed(a, b)
+    if 2 * short <= a.bit_length():
+        # lopsided: cut `a` into pieces as long as `b`
+        mask = (1 << short) - 1
+        result = 0
+        shift = 0
+        while a:
+            result ^= clmul(a & mask, b) << shift
+            a >>= short
+            shift += short
+        return result
+    # Karatsuba; in characteristic 2 the middle term is
+    # (a0 + a1)(b0 + b1) + a0 b0 + a1 b1, all additions being XOR
+    half = (a.bit_length() + 1) // 2
+    mask = (1 << half) - 1
+    a0, a1 = a & mask, a >> half
+    b0, b1 = b & mask, b >> half
+    z0 = clmul(a0, b0)
+    z2 = clmul(a1, b1)
+    z1 = clmul(a0 ^ a1, b0 ^ b1) ^ z0 ^ z2
+    return z0 ^ (z1 << half) ^ (z2 << (2 * half))
+
+def clsqr(a: int):
+    """
+    Square in GF(2)[x]: cross terms cancel, so squaring
+    just spreads the bits apart (x^k -> x^2k).
+    Done on the binary string, without a Python loop.
+    """
+    if a == 0:
+        return 0
+    raw = bin(a)[2:].encode().translate(_FROM_ASCII)
+    spread = bytearray(2 * len(raw) - 1)
+    spread[::2] = raw
+    return int(spread.translate(_TO_ASCII), 2)
+
+def divmod_bits(a: int, b: int):
+    """
+    Euclidean division in GF(2)[x] by shift-and-XOR.
+    Returns (quotient, remainder).
+    """
+    if b == 0:
+        raise ZeroDivisionError
+    n = b.bit_length()
+    quotient = 0
+    while a.bit_length() >= n:
+        shift = a.bit_length() - n
+        a ^= b << shift
+        quotient |= 1 << shift
+    return quotient, a
+
+def mod_bits(a: int, b: int):
+    """
+    Remainder of `a` modulo `b` in GF(2)[x].
+    """
+    if b == 0:
+        raise ZeroDivisionError
+    n = b.bit_length()
+    while a.bit_length() >= n:
+        a ^= b << (a.bit_length() - n)
+    return a
+
+def gcd_bits(a: int, b: int):
+    """
+    Greatest common divisor in GF(2)[x].
+    Always monic, since the only nonzero coefficient is 1.
+    """
+    while b:
+        a, b = b, mod_bits(a, b)
+    return a
+
+def powmod_bits(a: int, exponent: int, f: int):
+    """
+    a^exponent modulo f, by square-and-multiply.
+    """
+    result = 1
+    a = mod_bits(a, f)
+    for bit in bin(exponent)[2:]:
+        result = mod_bits(clsqr(result), f)
+        if bit == "1":
+            result = mod_bits(clmul(result, a), f)
+    return mod_bits(result, f)
+
+def frobenius_bits(n: int, f: int):
+    """
+    x^(2^n) modulo f: n successive squarings of x.
+    """
+    result = mod_bits(2, f)
+    for _ in range(n):
+        result = mod_bits(clsqr(result), f)
+    return result
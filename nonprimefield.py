@@ -2,22 +2,111 @@
 
 # contains logic for GF(p^n) arithmetic
 # field operations and exponentiation
-# latter is done thru a lookup table
+# an element is stored as one int, its code: the coefficients
+# read as base-p digits (the bit-packed form in characteristic 2)
+# small fields get typed lookup tables over the codes:
+# powers[k] = code of a^k, logs[code] = k, and with Zech's logarithms
+# Z(k), a^Z(k) = 1 + a^k, addition becomes integer arithmetic too
+# fields too large for the tables are table-free: codes are
+# decoded, multiplied modulo quotpoly and inverted
+# by the extended Euclidean algorithm
 
+from array import array
+from math import gcd
+from operator import mul
+
+import gf2poly as gf2
+import numtheory as nt
 import polynomial as pol
 import pprops
 
+# typecode of the lookup tables; codes and logarithms
+# stay below p^n, which the memory budget keeps far below 2^32
+TABLE_TYPECODE = "I"
+# setfield builds the lookup tables only if they are estimated
+# to fit in this many bytes; larger fields go table-free
+TABLE_MEMORY_BUDGET = 256 * 2**20
+# bytes per field element taken by the power, log and Zech tables
+TABLE_ENTRY_BYTES = 3 * array(TABLE_TYPECODE).itemsize
+
+def table_bytes(p: int, n: int):
+    """
+    Estimated size in bytes of the lookup tables for GF(p^n).
+    """
+    return (p ** n - 1) * TABLE_ENTRY_BYTES
+
+def encode(poly):
+    """
+    Compact integer code of a reduced polynomial:
+    its coefficients read as base-p digits, constant term lowest.
+    In characteristic 2 this is the bit-packed form.
+    """
+    if pol.FCH == 2:
+        return pol.gf2_bits(poly)
+    p = pol.FCH
+    code = 0
+    for c in reversed(poly.coeffs):
+        code = code * p + c
+    return code
+
+def decode(code: int):
+    """
+    The polynomial with integer code `code`; inverse of encode().
+    """
+    if pol.FCH == 2:
+        return pol.from_gf2_bits(code)
+    p = pol.FCH
+    cfs = []
+    while code:
+        code, c = divmod(code, p)
+        cfs.append(c)
+    return pol.Poly(cfs or [0])
+
 class FieldEl():
+    __slots__ = ("code",)
+
     # polynomial that defines the field
     quotpoly = None
-    # power lookup for multiplication and addition
+    # the same, prepared for repeated reduction (pol.PolyModulus)
+    modulus = None
+    # p^n - 1, the order of the multiplicative group
+    grpsize = None
+    # power lookup: powers[k] = code of a^k
     powers = None
+    # the reverse: logs[code] = k; logs[0] = grpsize stands for zero
+    logs = None
+    # Zech's logarithms: zech[k] = log(1 + a^k), grpsize where
+    # 1 + a^k = 0; optional, see setfield
+    zech = None
+    # set when the field has no tables; the other three are None then
+    table_free = False
     
-    def setfield(poly):
+    def reset():
+        """
+        Forgets the current field and its tables.
+        """
+        FieldEl.quotpoly = None
+        FieldEl.modulus = None
+        FieldEl.grpsize = None
+        FieldEl.powers = None
+        FieldEl.logs = None
+        FieldEl.zech = None
+        FieldEl.table_free = False
+
+    reset = staticmethod(reset)
+
+    def setfield(poly, zech: bool = True, tables: bool = None):
         """
         Sets the polynomial `poly` such that F_p[x]/(poly) = GF(p^n).
         p = pol.FCH, the field characteristic.
-        Prepares the exponential lookup table (actually a list).
+        Prepares the exponential and logarithm lookup tables
+        (typed arrays over the element codes).
+        With `zech`, also the Zech logarithm table, so that
+        addition and subtraction need no polynomial arithmetic;
+        characteristic 2 has no use for it, adding codes by XOR.
+        With `tables` left as None, the tables are only built
+        if table_bytes() is within TABLE_MEMORY_BUDGET;
+        otherwise the field is table-free.
         Flushes all stored field elements.
 
         Input `poly` must be a primitive polynomial.
@@ -27,106 +116,297 @@ class FieldEl():
                              f"GF({pol.FCH}^{poly.degree()}) "
                              f"on polynomial {str(poly)} -- "
                              "Not primitive.")
-        
-        # constant multiplier makes no difference
-        # but it's nice to have quotpoly be monic
-        FieldEl.quotpoly = poly.monify()
 
         p = pol.FCH
         n = poly.degree()
+        grpsize = p ** n - 1
+
+        if tables is None:
+            tables = table_bytes(p, n) <= TABLE_MEMORY_BUDGET
+            if not tables:
+                print(f"Lookup tables for GF({p}^{n}) would exceed "
+                      f"{TABLE_MEMORY_BUDGET // 2**20} MB; "
+                      "using table-free arithmetic.")
+        # the tables store codes up to grpsize
+        if tables and grpsize >= 2 ** (8 * array(TABLE_TYPECODE).itemsize):
+            raise ValueError("Cannot build lookup tables for "
+                             f"GF({p}^{n}) -- element codes do not fit "
+                             f"in array('{TABLE_TYPECODE}'). "
+                             "Use table-free arithmetic.")
+
+        # constant multiplier makes no difference
+        # but it's nice to have quotpoly be monic
+        FieldEl.quotpoly = poly.monify()
+        FieldEl.modulus = pol.PolyModulus(FieldEl.quotpoly)
+        FieldEl.grpsize = grpsize
+        FieldEl.table_free = not tables
+        if not tables:
+            FieldEl.powers = None
+            FieldEl.logs = None
+            FieldEl.zech = None
+            return
 
-        fieldsize = p ** n - 2
+        fieldsize = grpsize - 1
 
-        power_lookup = [pol.constant(1)]
-        for i in range(1,p**n - 1):
-            next_power = ( (power_lookup[-1] * pol.monomial(1,1))
-                           % FieldEl.quotpoly)
-            power_lookup.append(next_power.__copy__())
-            if i % 10000 == 0:
-                print(f"Computed powers up to {i} of {fieldsize}...")
+        power_lookup = array(TABLE_TYPECODE, [0]) * grpsize
+        log_lookup = array(TABLE_TYPECODE, [grpsize]) * (grpsize + 1)
+        power_lookup[0] = 1
+        log_lookup[1] = 0
+        code = 1
+        if p == 2:
+            # multiplying by x is a shift, reducing is one XOR
+            quotbits = pol.gf2_bits(FieldEl.quotpoly)
+            for i in range(1, grpsize):
+                code <<= 1
+                if code >> n:
+                    code ^= quotbits
+                power_lookup[i] = code
+                log_lookup[code] = i
+                if i % 10000 == 0:
+                    print(f"Computed powers up to {i} of {fieldsize}...")
+        else:
+            # multiplying by x shifts the digits up; the digit shifted
+            # out at the top comes back as `top` times x^n mod quotpoly
+            low = [-c % p for c in FieldEl.quotpoly.coeffs[:n]]
+            weights = [p ** j for j in range(n)]
+            digits = [1] + [0] * (n - 1)
+            for i in range(1, grpsize):
+                top = digits[-1]
+                digits = [top * low[0] % p] + [(d + top * c) % p
+                                               for d, c in zip(digits, low[1:])]
+                code = sum(map(mul, digits, weights))
+                power_lookup[i] = code
+                log_lookup[code] = i
+                if i % 10000 == 0:
+                    print(f"Computed powers up to {i} of {fieldsize}...")
 
         FieldEl.powers = power_lookup
+        FieldEl.logs = log_lookup
+        FieldEl.zech = None
+        if zech and p != 2:
+            FieldEl.zech = FieldEl.zech_table()
 
     setfield = staticmethod(setfield)
 
+    def zech_table():
+        """
+        Zech's logarithms of the current field, from the log table:
+        adding 1 to a^k changes only the constant digit of its code.
+        """
+        p = pol.FCH
+        logs = FieldEl.logs
+        zech_lookup = array(TABLE_TYPECODE, [0]) * FieldEl.grpsize
+        for k, code in enumerate(FieldEl.powers):
+            digit = code % p
+            # logs[0] marks 1 + a^k = 0
+            zech_lookup[k] = logs[code - digit + (digit + 1) % p]
+        return zech_lookup
+
+    zech_table = staticmethod(zech_table)
+
+    def from_code(code: int):
+        """
+        The element with integer code `code`, taken as is.
+        """
+        el = FieldEl.__new__(FieldEl)
+        el.code = code
+        return el
+
+    from_code = staticmethod(from_code)
+
+    def from_dlog(k):
+        """
+        The element a^k, straight from the power table;
+        k = None gives zero.
+        """
+        if k is None:
+            return FieldEl.from_code(0)
+        return FieldEl.from_code(FieldEl.powers[k % FieldEl.grpsize])
+
+    from_dlog = staticmethod(from_dlog)
+
+    def group_order():
+        """
+        p^n - 1, the order of the multiplicative group.
+        """
+        return FieldEl.grpsize
+
+    group_order = staticmethod(group_order)
+
+    def neg_dlog():
+        """
+        log(-1): 0 in characteristic 2, (p^n - 1)/2 otherwise.
+        """
+        if pol.FCH == 2:
+            return 0
+        return FieldEl.grpsize // 2
+
+    neg_dlog = staticmethod(neg_dlog)
+
     def __init__(self, inp):
         """
         Initializes field element based on input,
         which can be either a Poly or a coefficient list.
         """
         if isinstance(inp, pol.Poly):
-            self.poly = inp % FieldEl.quotpoly
+            self.code = encode(inp % FieldEl.modulus)
         elif isinstance(inp, list):
-            self.poly = pol.Poly(inp) % FieldEl.quotpoly
+            self.code = encode(pol.Poly(inp) % FieldEl.modulus)
         elif isinstance(inp, int):
-            self.poly = pol.constant(inp)
-            
-        if self.poly.is_zero():
-            self.dlog = None
-        else:
-            self.dlog = FieldEl.powers.index(self.poly)
+            # constants are already reduced
+            self.code = encode(pol.constant(inp))
+
+    @property
+    def poly(self):
+        """
+        The element as a reduced polynomial.
+        """
+        return decode(self.code)
+
+    @property
+    def dlog(self):
+        """
+        The discrete logarithm; None for zero
+        and for every element of a table-free field.
+        """
+        if self.code == 0 or FieldEl.table_free:
+            return None
+        return FieldEl.logs[self.code]
 
     def __str__(self):
         # prints the same as polynomials
         # but with 'a' as the variable
         return self.poly.str_custom(varname="a")
 
+    def is_zero(self):
+        return self.code == 0
+
     def __eq__(self, other):
-        return self.poly == other.poly
+        return self.code == other.code
+
+    def add_dlogs(i, j):
+        """
+        Code of a^i + a^j by Zech's logarithms:
+        a^i + a^j = a^i (1 + a^(j-i)) = a^(i + Z(j-i)).
+        """
+        grpsize = FieldEl.grpsize
+        z = FieldEl.zech[(j - i) % grpsize]
+        if z == grpsize:
+            return 0
+        return FieldEl.powers[(i + z) % grpsize]
+
+    add_dlogs = staticmethod(add_dlogs)
 
     def __add__(self, other):
         """
-        Addition as polynomials.
-        Reduction modulo quotpoly is handled by init method.
+        Addition: XOR of the codes in characteristic 2,
+        otherwise by Zech's logarithms if the table was built,
+        and as polynomials failing that.
         """
-        return FieldEl(self.poly + other.poly)
+        if pol.FCH == 2:
+            return FieldEl.from_code(self.code ^ other.code)
+        if self.code == 0:
+            return other
+        if other.code == 0:
+            return self
+        if FieldEl.zech is None:
+            return FieldEl(self.poly + other.poly)
+        logs = FieldEl.logs
+        return FieldEl.from_code(FieldEl.add_dlogs(logs[self.code],
+                                                   logs[other.code]))
 
     def __sub__(self, other):
         """
-        Subtraction is basically the same as addition.
+        Subtraction: a - b = a + (-1) b.
         """
-        return FieldEl(self.poly - other.poly)
+        if pol.FCH == 2:
+            return FieldEl.from_code(self.code ^ other.code)
+        if other.code == 0:
+            return self
+        if FieldEl.zech is None:
+            return FieldEl(self.poly - other.poly)
+        logs = FieldEl.logs
+        negated = logs[other.code] + FieldEl.neg_dlog()
+        if self.code == 0:
+            return FieldEl.from_dlog(negated)
+        return FieldEl.from_code(FieldEl.add_dlogs(logs[self.code], negated))
 
     def __mul__(self, other):
         """
         multiplication using the lookup table.
         """
+        if isinstance(other, int):
+            # a constant c of F_p has code c
+            other = FieldEl.from_code(other % pol.FCH)
+
         # either factor is 0 => product is 0
-        if self.poly.is_zero() or other.poly.is_zero():
-            return FieldEl(0)
+        if self.code == 0 or other.code == 0:
+            return FieldEl.from_code(0)
 
-        if isinstance(other, int):
-            return FieldEl(self.poly.scale(other))
+        if FieldEl.table_free:
+            if pol.FCH == 2:
+                return FieldEl.from_code(
+                    gf2.mod_bits(gf2.clmul(self.code, other.code),
+                                 FieldEl.modulus.bits))
+            return FieldEl.from_code(encode(
+                FieldEl.modulus.mulmod(self.poly, other.poly)))
 
         # otherwise, a * b = powers[a.dlog + b.dlog]
-        idx = (self.dlog + other.dlog) % len(FieldEl.powers)
-        return FieldEl(FieldEl.powers[idx])
+        logs = FieldEl.logs
+        return FieldEl.from_dlog(logs[self.code] + logs[other.code])
 
     def __truediv__(self, other):
         """
         division using the lookup table.
         """
         # NOT eucdiv!!! this is a field!
+        return self * other.inverse()
 
-        if other.poly.is_zero():
-            raise ZeroDivisionError("Cannot divide by zero in "+
-                                    "finite field modulo "+
-                                    str(FieldEl.quotpoly))
+    def __pow__(self, n: int):
+        """
+        Exponentiation using the lookup table,
+        or square-and-multiply in a table-free field.
+        """
+        if self.code == 0:
+            return self
 
-        if self.poly.is_zero():
-            return FieldEl(0)
+        if not FieldEl.table_free:
+            return FieldEl.from_dlog(FieldEl.logs[self.code] * n)
 
-        # otherwise, a / b = powers[a.dlog - b.dlog]
-        idx = (self.dlog - other.dlog) % len(FieldEl.powers)
-        return FieldEl(FieldEl.powers[idx])
+        # a^(p^n - 1) = 1 for every nonzero a
+        n %= FieldEl.grpsize
+        if pol.FCH == 2:
+            return FieldEl.from_code(
+                gf2.powmod_bits(self.code, n, FieldEl.modulus.bits))
+        return FieldEl.from_code(encode(FieldEl.modulus.powmod(self.poly, n)))
 
-    def __pow__(self, n: int):
+    def inverse(self):
         """
-        Exponentiation using the lookup table.
+        Multiplicative inverse: a^(-log) with the tables,
+        otherwise the Bezout coefficient of a against quotpoly.
         """
+        if self.code == 0:
+            raise ZeroDivisionError("Cannot divide by zero in "+
+                                    "finite field modulo "+
+                                    str(FieldEl.quotpoly))
+        if not FieldEl.table_free:
+            return FieldEl.from_dlog(-FieldEl.logs[self.code])
 
-        if self.poly.is_zero():
-            return FieldEl(0)
+        # quotpoly is irreducible, so gcd = 1 = coeff1 * a + coeff2 * quotpoly
+        coeff1 = pol.ext_euclid_algo(self.poly, FieldEl.quotpoly)[1]
+        return FieldEl.from_code(encode(coeff1 % FieldEl.modulus))
 
-        idx = (self.dlog * n) % len(FieldEl.powers)
-        return FieldEl(FieldEl.powers[idx])
+    def order(self):
+        """
+        Order of a nonzero element in the multiplicative group:
+        from the logarithm when there are tables, otherwise
+        by dividing primes out of p^n - 1 while a^(order/q) = 1.
+        """
+        grpsize = FieldEl.grpsize
+        if not FieldEl.table_free:
+            return grpsize // gcd(grpsize, FieldEl.logs[self.code])
+        result = grpsize
+        for q in nt.factorize(grpsize):
+            while result % q == 0 and (self ** (result // q)).code == 1:
+                result //= q
+        return result
@@ -0,0 +1,298 @@
+# numtheory module
+
+# contains primality testing and integer factorization,
+# for the integers the rest of the program cares about:
+# field characteristics and group orders p^n - 1
+
+# primality:
+# - trial division by the primes below SMALL_PRIME_LIMIT first
+# - Miller-Rabin with a fixed set of bases, which is deterministic
+#   below MR_DETERMINISTIC_LIMIT (so for every 64-bit input)
+# - Baillie-PSW (Miller-Rabin to base 2 plus a strong Lucas test)
+#   above that; no composite is known to pass it
+# factorization:
+# - trial division by the small primes
+# - Pollard's rho with Brent's cycle finding, up to RHO_LIMIT steps,
+#   which finds factors up to about 10^10 quickly
+# - then a light elliptic curve method (Montgomery curves,
+#   stage 1 only) for the larger factors rho would take long on
+# - and rho without a limit as the last resort
+# factorizations are remembered in factor_cache, up to
+# FACTOR_CACHE_SIZE of them, oldest dropped first;
+# fileio saves and loads them along with the verdict cache
+
+import random
+from math import gcd, isqrt
+
+SMALL_PRIME_LIMIT = 1000
+MR_DETERMINISTIC_LIMIT = 3317044064679887385961981
+RHO_LIMIT = 1 << 16
+# (B1, number of curves) per round
+ECM_SCHEDULE = [(2000, 25), (11000, 90), (50000, 300)]
+FACTOR_CACHE_SIZE = 1024
+
+def _small_primes(limit: int):
+    # sieve of Eratosthenes
+    sieve = bytearray([1]) * limit
+    sieve[0:2] = b"\x00\x00"
+    for i in range(2, isqrt(limit - 1) + 1):
+        if sieve[i]:
+            sieve[i * i::i] = bytes(len(range(i * i, limit, i)))
+    return [i for i in range(limit) if sieve[i]]
+
+SMALL_PRIMES = _small_primes(SMALL_PRIME_LIMIT)
+_MR_BASES = SMALL_PRIMES[:13]
+
+# n -> {prime: exponent}, in insertion order
+factor_cache = {}
+
+def _strong_probable_prime(n: int, base: int):
+    # Miller-Rabin round: n - 1 = d 2^s, d odd
+    d = n - 1
+    s = 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    x = pow(base, d, n)
+    if x == 1 or x == n - 1:
+        return True
+    for _ in range(s - 1):
+        x = x * x % n
+        if x == n - 1:
+            return True
+    return False
+
+def jacobi(a: int, n: int):
+    """
+    The Jacobi symbol (a/n), for odd positive n.
+    """
+    a %= n
+    result = 1
+    while a != 0:
+        while a % 2 == 0:
+            a //= 2
+            if n % 8 in (3, 5):
+                result = -result
+        a, n = n, a
+        if a % 4 == 3 and n % 4 == 3:
+            result = -result
+        a %= n
+    return result if n == 1 else 0
+
+def _strong_lucas_probable_prime(n: int):
+    # Selfridge's parameters: the first D in 5, -7, 9, -11, ...
+    # with (D/n) = -1, then P = 1, Q = (1 - D)/4
+    root = isqrt(n)
+    if root * root == n:
+        return False
+    D = 5
+    while True:
+        j = jacobi(D, n)
+        if j == -1:
+            break
+        if j == 0 and abs(D) != n:
+            return False
+        D = -D - 2 if D > 0 else -D + 2
+    P = 1
+    Q = (1 - D) // 4
+    # n + 1 = d 2^s, d odd
+    d = n + 1
+    s = 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+
+    def half(x):
+        # x/2 mod n, n being odd
+        return (x + n) // 2 % n if x % 2 else x // 2 % n
+
+    # U_d, V_d and Q^d by the binary method
+    U, V, Qk = 1, P, Q % n
+    for bit in bin(d)[3:]:
+        U = U * V % n
+        V = (V * V - 2 * Qk) % n
+        Qk = Qk * Qk % n
+        if bit == "1":
+            U, V = half(P * U + V), half(D * U + P * V)
+            Qk = Qk * Q % n
+    if U == 0 or V == 0:
+        return True
+    for _ in range(s - 1):
+        V = (V * V - 2 * Qk) % n
+        Qk = Qk * Qk % n
+        if V == 0:
+            return True
+    return False
+
+def is_prime(n: int):
+    """
+    Checks whether n is prime. Exact below MR_DETERMINISTIC_LIMIT,
+    Baillie-PSW above it.
+    """
+    if n < 2:
+        return False
+    for p in SMALL_PRIMES:
+        if n % p == 0:
+            return n == p
+    if n < SMALL_PRIME_LIMIT ** 2:
+        return True
+    if n < MR_DETERMINISTIC_LIMIT:
+        return all(_strong_probable_prime(n, base) for base in _MR_BASES)
+    return (_strong_probable_prime(n, 2)
+            and _strong_lucas_probable_prime(n))
+
+def pollard_brent(n: int, limit: int = None):
+    """
+    Looks for a nontrivial factor of an odd composite n
+    by Pollard's rho with Brent's cycle finding.
+    Gives up and returns None after about `limit` steps,
+    if one is given.
+    """
+    # gcds are taken over batches of this many steps
+    batch = 128
+    steps = 0
+    while True:
+        y = random.randrange(1, n)
+        c = random.randrange(1, n)
+        g = r = q = 1
+        while g == 1:
+            x = y
+            for _ in range(r):
+                y = (y * y + c) % n
+            k = 0
+            while k < r and g == 1:
+                saved = y
+                for _ in range(min(batch, r - k)):
+                    y = (y * y + c) % n
+                    q = q * abs(x - y) % n
+                g = gcd(q, n)
+                k += batch
+            r *= 2
+            steps += r
+            if limit is not None and steps > limit and g == 1:
+                return None
+        if g == n:
+            # the batch overshot; redo it one step at a time
+            g = 1
+            while g == 1:
+                saved = (saved * saved + c) % n
+                g = gcd(abs(x - saved), n)
+        if g != n:
+            return g
+        # unlucky choice of c; try another
+
+def _ecm_stage1(n: int, B1: int, primes: list):
+    # one curve of Lenstra's elliptic curve method on a Montgomery curve
+    # with Suyama's parametrization; returns a factor of n or None
+    sigma = random.randrange(6, n - 1)
+    u = (sigma * sigma - 5) % n
+    v = 4 * sigma % n
+    x = pow(u, 3, n)
+    z = pow(v, 3, n)
+    denominator = 16 * x * v % n
+    g = gcd(denominator, n)
+    if g != 1:
+        return g if g != n else None
+    a24 = pow(v - u, 3, n) * (3 * u + v) * pow(denominator, -1, n) % n
+
+    def double(X, Z):
+        s = (X + Z) * (X + Z) % n
+        t = (X - Z) * (X - Z) % n
+        diff = s - t
+        return s * t % n, diff * (t + a24 * diff) % n
+
+    def add(X1, Z1, X2, Z2, X0, Z0):
+        # P1 + P2, knowing P1 - P2 = P0
+        a = (X1 - Z1) * (X2 + Z2) % n
+        b = (X1 + Z1) * (X2 - Z2) % n
+        return Z0 * (a + b) ** 2 % n, X0 * (a - b) ** 2 % n
+
+    def multiply(k, X, Z):
+        # Montgomery ladder
+        R0, R1 = (X, Z), double(X, Z)
+        for bit in bin(k)[3:]:
+            if bit == "1":
+                R0 = add(*R0, *R1, X, Z)
+                R1 = double(*R1)
+            else:
+                R1 = add(*R0, *R1, X, Z)
+                R0 = double(*R0)
+        return R0
+
+    for p in primes:
+        if p > B1:
+            break
+        # the largest power of p up to B1
+        q = p
+        while q * p <= B1:
+            q *= p
+        x, z = multiply(q, x, z)
+    g = gcd(z, n)
+    if 1 < g < n:
+        return g
+    return None
+
+def _find_factor(n: int):
+    # a nontrivial factor of the odd composite n
+    factor = pollard_brent(n, RHO_LIMIT)
+    if factor is not None:
+        return factor
+    for B1, curves in ECM_SCHEDULE:
+        primes = _small_primes(B1 + 1)
+        for _ in range(curves):
+            factor = _ecm_stage1(n, B1, primes)
+            if factor is not None:
+                return factor
+    return pollard_brent(n)
+
+def factorize(n: int):
+    """
+    Factors a positive integer.
+    Returns a dict of {prime: exponent}.
+    """
+    if n <= 0:
+        raise ValueError("Attempted to factorize "+
+                         f"nonpositive integer {n}!")
+    if n in factor_cache:
+        return dict(factor_cache[n])
+    original = n
+    result = {}
+    for p in SMALL_PRIMES:
+        if p * p > n:
+            break
+        while n % p == 0:
+            result[p] = result.get(p, 0) + 1
+            n //= p
+    # whatever is left has no factors below SMALL_PRIME_LIMIT
+    pending = [n] if n > 1 else []
+    while pending:
+        m = pending.pop()
+        if m in factor_cache:
+            for p, e in factor_cache[m].items():
+                result[p] = result.get(p, 0) + e
+        elif is_prime(m):
+            result[m] = result.get(m, 0) + 1
+        else:
+            d = _find_factor(m)
+            pending += [d, m // d]
+    result = dict(sorted(result.items()))
+    remember_factorization(original, result)
+    return dict(result)
+
+def remember_factorization(n: int, factors: dict):
+    """
+    Puts the factorization `factors` ({prime: exponent}) of n
+    into factor_cache, dropping the oldest entries over the limit.
+    """
+    factor_cache[n] = dict(sorted(factors.items()))
+    while len(factor_cache) > FACTOR_CACHE_SIZE:
+        del factor_cache[next(iter(factor_cache))]
+
+def divisors(n: int):
+    """
+    All positive divisors of n, sorted, 1 and n included.
+    """
+    result = [1]
+    for p, e in factorize(n).items():
+        result = [d * p ** k for d in result for k in range(e + 1)]
+    return sorted(result)
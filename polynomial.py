@@ -3,9 +3,21 @@
 # contains the polynomial class
 # as well as a few functions to do with polynomials
 
+import sys
+from array import array
 from enum import Flag, auto
+from math import isqrt
 
 import auxiliaries as aux
+# bit-packed arithmetic, used automatically in characteristic 2
+import gf2poly as gf2
+
+# NumPy is optional: if present, coefficient-wise operations
+# on long polynomials are vectorized (see the NumPy backend below)
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 # field characteristic
 FCH = 7
@@ -50,10 +62,133 @@ opttags = {"deg": DisplayFlag.DESCENDING, "bal": DisplayFlag.BALANCED}
 singleopts_names = {"deg": ("Term order", "Ascending", "Descending"),
                     "bal": ("Coefficient display", "Unbalanced", "Balanced")}
 
-# polynomials stored as lists of coefficients
+# coefficient storage: a typed array just wide enough for 0..FCH-1
+# ('B' for FCH <= 256, 'H' up to 65536, and so on),
+# or a plain list if FCH does not fit in 64 bits.
+# cached as (FCH, typecode) since FCH can change at runtime
+_storage_cache = (None, None)
+
+def storage_typecode():
+    """
+    Returns the array typecode used to store coefficients
+    for the current characteristic, or None for plain lists.
+    """
+    global _storage_cache
+    if _storage_cache[0] != FCH:
+        typecode = None
+        for size in sorted(_SLOT_TYPECODES):
+            if FCH <= 2 ** (8 * size):
+                typecode = _SLOT_TYPECODES[size]
+                break
+        _storage_cache = (FCH, typecode)
+    return _storage_cache[1]
+
+## NumPy backend
+
+# vectorized add/sub/scale/normalize/evaluation/linear combination.
+# coefficients are read straight out of the storage arrays' buffers
+# and worked on as int64, which is exact as long as products of two
+# coefficients fit: hence the bound on FCH.
+# set USE_NUMPY = False to force the pure-Python path.
+USE_NUMPY = np is not None
+# below this many coefficients, conversion overhead outweighs the gain
+NUMPY_THRESHOLD = 64
+
+def numpy_usable(length: int):
+    """
+    Whether the NumPy backend should handle `length` coefficients.
+    """
+    return USE_NUMPY and length >= NUMPY_THRESHOLD and FCH < 2 ** 31
+
+def _to_numpy(cfs):
+    """
+    int64 vector of a coefficient sequence.
+    Arrays are read through their buffer without a Python-level loop.
+    Raises OverflowError if an entry does not fit in 64 bits.
+    """
+    if isinstance(cfs, array):
+        return np.frombuffer(cfs, dtype=cfs.typecode).astype(np.int64)
+    return np.array(cfs, dtype=np.int64)
+
+def _from_numpy(vec):
+    """
+    Poly from an int64 vector with entries already in 0..FCH-1:
+    trims leading zeroes and packs into storage, skipping normalize().
+    """
+    nonzero = np.flatnonzero(vec)
+    length = int(nonzero[-1]) + 1 if len(nonzero) > 0 else 1
+    cfs = array(storage_typecode())
+    cfs.frombytes(vec[:length].astype(cfs.typecode).tobytes())
+    result = Poly.__new__(Poly)
+    result.coeffs = cfs
+    return result
+
+def _numpy_addsub(a, b, sign: int):
+    """
+    a + sign * b for coefficient sequences a, b (sign is 1 or -1).
+    """
+    va, vb = _to_numpy(a), _to_numpy(b)
+    total = np.zeros(max(len(va), len(vb)), dtype=np.int64)
+    total[:len(va)] += va
+    total[:len(vb)] += sign * vb
+    return _from_numpy(total % FCH)
+
+def _numpy_peval(cfs, x: int):
+    """
+    Evaluates a coefficient sequence at x, blockwise:
+    the coefficients are cut into rows of k ~ sqrt(n),
+    all rows are evaluated at once against x^0..x^(k-1),
+    and Horner's rule in x^k combines the rows.
+    """
+    p = FCH
+    x %= p
+    vec = _to_numpy(cfs)
+    n = len(vec)
+    k = isqrt(n)
+    rows = -(-n // k)
+    padded = np.zeros(rows * k, dtype=np.int64)
+    padded[:n] = vec
+    powers = [1] * k
+    for j in range(1, k):
+        powers[j] = powers[j-1] * x % p
+    # each product is below p^2 < 2^62, each row sum below k*p
+    row_values = ((padded.reshape(rows, k) * np.array(powers, dtype=np.int64))
+                  % p).sum(axis=1) % p
+    xk = pow(x, k, p)
+    result = 0
+    for value in reversed(row_values.tolist()):
+        result = (result * xk + value) % p
+    return result
+
+## characteristic 2
+
+# in characteristic 2, Poly arithmetic converts to the bit-packed
+# ints of gf2poly (a bytes translation, no Python loop),
+# computes there, and converts back
+
+def gf2_bits(poly):
+    """
+    The coefficients of a Poly over GF(2), packed into an int.
+    """
+    return gf2.from_coeffs(poly.coeffs)
+
+def from_gf2_bits(bits: int):
+    """
+    Poly over GF(2) from a packed int. Skips normalize():
+    the unpacked array is already trimmed and in storage format.
+    """
+    result = Poly.__new__(Poly)
+    result.coeffs = gf2.to_coeffs(bits)
+    return result
+
+# polynomials stored as arrays (see above) of coefficients
 # in ascending order, so p.coeffs[i] == x^i coefficient
 class Poly():
+    # no per-instance __dict__: a Poly is just its coefficient buffer
+    __slots__ = ("coeffs",)
+
     def __init__(self, cfs: list=[0]):
+        # any sequence of ints will do: list, array, memoryview...
         self.coeffs = cfs
         # empty list => zero polynomial
         if len(self.coeffs) == 0:
@@ -106,18 +241,40 @@ class Poly():
     def normalize(self):
         """
         Normalizes all coefficients to range 0..FCH-1,
-        and trims leading zeroes.
+        trims leading zeroes, and packs them into compact storage.
         In case of the zero polynomial, keeps the sole zero coefficient.
         """
-        self.coeffs = list(map(lambda n: n % FCH, self.coeffs))
+        p = FCH
+        if numpy_usable(len(self.coeffs)):
+            try:
+                vec = _to_numpy(self.coeffs)
+            except OverflowError:
+                # unreduced entries too big for int64
+                pass
+            else:
+                self.coeffs = _from_numpy(vec % p).coeffs
+                return
+        cfs = [c % p for c in self.coeffs]
         # trim zeroes
-        zeroidx = len(self.coeffs)-1
-        while zeroidx > 0 and self.coeffs[zeroidx] == 0:
-            zeroidx -= 1
-        del self.coeffs[zeroidx+1:]
+        while len(cfs) > 1 and cfs[-1] == 0:
+            cfs.pop()
+        typecode = storage_typecode()
+        if typecode is not None:
+            cfs = array(typecode, cfs)
+        self.coeffs = cfs
+
+    def coeff_view(self, start: int = 0, stop: int = None, step: int = 1):
+        """
+        A read-only slice of the coefficients.
+        Zero-copy (a memoryview) for array storage,
+        an ordinary list slice otherwise.
+        """
+        if isinstance(self.coeffs, array):
+            return memoryview(self.coeffs)[start:stop:step]
+        return self.coeffs[start:stop:step]
 
     def __copy__(self):
-        newcoeffs = self.coeffs.copy()
+        newcoeffs = self.coeffs[:]
         return Poly(newcoeffs)
 
     def degree(self):
@@ -128,9 +285,9 @@ class Poly():
 
     def is_zero(self):
         """
-        Determines whether the polynomial is zero. Hacky.
+        Determines whether the polynomial is zero.
+        Relies on coefficients always being normalized.
         """
-        self.normalize()
         if len(self.coeffs) == 1 and self.coeffs[0] == 0:
             return True
         return False
@@ -139,6 +296,8 @@ class Poly():
         """
         Multiplies all coeffs in a polynomial by a scalar.
         """
+        if numpy_usable(len(self.coeffs)):
+            return _from_numpy(_to_numpy(self.coeffs) * (scalar % FCH) % FCH)
         result = Poly([0])
         result.coeffs = list(map(lambda n: scalar * n, self.coeffs))
         result.normalize()
@@ -157,25 +316,28 @@ class Poly():
     def __eq__(self, other):
         """
         Determines if two polynomials are equal.
-        Normalizes both before proceeding, for good measure.
+        Both are normalized on construction, so this is
+        a straight comparison of coefficient buffers.
         """
-        self.normalize()
-        other.normalize()
         # degrees unequal => polys unequal
         if self.degree() != other.degree():
             return False
         # degrees equal => check equality of coeffs
-        for i in range(self.degree() + 1):
-            if self.coeffs[i] != other.coeffs[i]:
-                return False
-        # if we made it through the loop,
-        # the degrees are equal and all coeffs match
-        return True
+        mine, theirs = self.coeffs, other.coeffs
+        # arrays compare against arrays (of any typecode) in C,
+        # but never compare equal to lists
+        if isinstance(mine, array) != isinstance(theirs, array):
+            mine, theirs = list(mine), list(theirs)
+        return mine == theirs
 
     def __add__(self, other):
         """
         Adds two polynomials.
         """
+        if FCH == 2:
+            return from_gf2_bits(gf2_bits(self) ^ gf2_bits(other))
+        if numpy_usable(max(len(self.coeffs), len(other.coeffs))):
+            return _numpy_addsub(self.coeffs, other.coeffs, 1)
         total = Poly([0])
         total.coeffs = [0] * max(len(self.coeffs),len(other.coeffs))
         n = len(total.coeffs)
@@ -191,6 +353,10 @@ class Poly():
         """
         Subtracts two polynomials (self - other).
         """
+        if FCH == 2:
+            return from_gf2_bits(gf2_bits(self) ^ gf2_bits(other))
+        if numpy_usable(max(len(self.coeffs), len(other.coeffs))):
+            return _numpy_addsub(self.coeffs, other.coeffs, -1)
         total = Poly([0])
         total.coeffs = [0] * max(len(self.coeffs),len(other.coeffs))
         n = len(total.coeffs)
@@ -205,22 +371,28 @@ class Poly():
     def __mul__(self, other):
         """
         Multiplies two polynomials.
+        The actual convolution is delegated to the multiplication
+        engine (see `mul_reduced`), which picks an algorithm
+        based on operand size and MUL_BACKEND.
+        In characteristic 2, carry-less multiplication is used instead.
         """
-        total = Poly([0])
+        if FCH == 2:
+            return from_gf2_bits(gf2.clmul(gf2_bits(self), gf2_bits(other)))
         # special case for 0 polynomial
         if self.degree() == -1 or other.degree() == -1:
-            return total
-        # polynomial degrees; assumes normalized
-        m = self.degree()
-        n = other.degree()
-        total.coeffs = [0]*(m+n+1)
-        # naive convolution
-        for i in range(m+1):
-            for j in range(n+1):
-                total.coeffs[i+j] += (self.coeffs[i]*other.coeffs[j]) % FCH
+            return Poly([0])
+        return Poly(mul_reduced(self.coeffs, other.coeffs))
 
-        total.normalize()
-        return total
+    def square(self):
+        """
+        Squares the polynomial. Same as self * self,
+        but lets the Kronecker backend pack the operand only once.
+        """
+        if FCH == 2:
+            return from_gf2_bits(gf2.clsqr(gf2_bits(self)))
+        if self.degree() == -1:
+            return Poly([0])
+        return Poly(sqr_reduced(self.coeffs))
 
     def __pow__(self, exponent: int):
         """
@@ -234,21 +406,21 @@ class Poly():
         elif exponent == 1:
             return self
         else:
-            temp = self ** (exponent // 2)
+            temp = (self ** (exponent // 2)).square()
             if exponent % 2 == 0:
-                return temp * temp
+                return temp
             else:
-                return temp * temp * self
+                return temp * self
 
     def __mod__(self, other):
         """
-        Computes `self % other` as follows:
-        1. Create list of polynomials congruent to x^i mod other,
-           for i from 0 up to self.degree().
-           Each of these is reduced so its degree is less than other.degree().
-        2. Take the linear combination of those, with the
-           coefficients of self as weights.
+        Computes `self % other`.
+        Reduction modulo a linear polynomial is just evaluation
+        at its root; everything else goes through `divmod_coeffs`.
+        `other` may also be a PolyModulus, which reuses its cached data.
         """
+        if isinstance(other, PolyModulus):
+            return other.reduce(self)
         if other.degree() == -1:
             raise ZeroDivisionError
         if other.degree() == 0:
@@ -256,20 +428,8 @@ class Poly():
         if other.degree() == 1:
             point = -other.coeffs[0] * pow(other.coeffs[1], -1, FCH)
             return Poly([self.peval(point)])
-        # make `other` monic by dividing out by its leading coefficient
-        other_monic = other.scale(pow(other.coeffs[-1], -1, FCH))
-        powers_mod_other = [Poly([0])] * len(self.coeffs)
-        powers_mod_other[0] = Poly([1])
-        for i in range(1,len(self.coeffs)):
-            # multiply by x
-            poly = powers_mod_other[i-1] * Poly([0,1])
-            # reduce mod other
-            # under normal circumstances, this >= should only ever be ==...
-            if poly.degree() >= other.degree():
-                coeff = poly.coeffs[-1]
-                poly = poly - other.scale(coeff)
-            powers_mod_other[i] = poly
-        return lincomb(self.coeffs, powers_mod_other)
+        _, rem = divmod_coeffs(self.coeffs, other.coeffs)
+        return Poly(rem)
 
     # for easier readability
     def __floordiv__(self, other):
@@ -328,10 +488,13 @@ class Poly():
         Evaluates the polynomial at a point.
         Implemented naively: compute x^i mod FCH iteratively,
         and add to the running total.
+        Long polynomials are evaluated blockwise by the NumPy backend.
         """
         # special case: polynomial is constant or needs to be eval'd at 0
         if self.degree() <= 0 or x == 0:
             return self.coeffs[0]
+        if numpy_usable(len(self.coeffs)):
+            return _numpy_peval(self.coeffs, x)
         
         result = 0
         power = 1 # holds x^i mod FCH
@@ -341,6 +504,14 @@ class Poly():
 
         return result
 
+    def peval_many(self, points):
+        """
+        Evaluates the polynomial at every point of `points` at once,
+        by remainders down a subproduct tree (see multipoint_eval).
+        Returns the list of values.
+        """
+        return multipoint_eval(self, points)
+
     def deriv(self, order: int = 1):
         """
         Takes the derivative of a polynomial to the specified order.
@@ -350,18 +521,660 @@ class Poly():
             raise ValueError(f"Cannot take derivative of order {order} -- "+
                              "order is negative.")
         if order == 1:
-            resultcfs = [0] * len(self.coeffs)
-            for i in range(len(self.coeffs)):
-                # self.coeffs[i] * x^i --> i * self.coeffs[i] * x^(i-1)
-                # derivative power rule
-                resultcfs[i] = (i * self.coeffs[i]) % FCH
-            result = Poly(resultcfs[1:])
-            result.normalize()
-            return result
+            # self.coeffs[i] * x^i --> i * self.coeffs[i] * x^(i-1)
+            # derivative power rule; the constant term drops out,
+            # so read from a view that skips it rather than a copy
+            return Poly([i * c for i, c in
+                         enumerate(self.coeff_view(1), start=1)])
         # order 2 or higher -- recursive
         return self.deriv(order-1).deriv()
                 
 
+## multiplication engine
+
+# all routines below work on plain coefficient lists
+# (ascending order, like Poly.coeffs) over the integers:
+# no reduction mod FCH happens until the caller normalizes.
+# this keeps Toom-3's divisions by 2 and 3 exact in every
+# characteristic, including 2 and 3 themselves.
+
+# crossover points, in coefficients of the SHORTER operand.
+# below KARATSUBA_THRESHOLD we use the schoolbook method,
+# below TOOM3_THRESHOLD Karatsuba, and Toom-3 above that.
+# tunable at runtime, e.g. `pol.KARATSUBA_THRESHOLD = 48`
+KARATSUBA_THRESHOLD = 40
+TOOM3_THRESHOLD = 150
+
+def mul_schoolbook(a: list, b: list):
+    """
+    Naive O(m*n) convolution of two coefficient lists.
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    result = [0] * (len(a) + len(b) - 1)
+    # one pass over the longer list per coefficient of the shorter one
+    for j, bj in enumerate(b):
+        if bj == 0:
+            continue
+        for i, ai in enumerate(a, j):
+            result[i] += ai * bj
+    return result
+
+def _add_into(target: list, source: list, offset: int = 0):
+    """
+    Adds `source` into `target` in place, starting at index `offset`.
+    `target` must be long enough.
+    """
+    for i, c in enumerate(source, offset):
+        target[i] += c
+
+def _add_lists(a: list, b: list):
+    """
+    Coefficient-wise sum of two lists of possibly different lengths.
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    result = a.copy()
+    for i, c in enumerate(b):
+        result[i] += c
+    return result
+
+def _sub_lists(a: list, b: list):
+    """
+    Coefficient-wise difference a - b of two lists.
+    """
+    result = a + [0] * (len(b) - len(a))
+    for i, c in enumerate(b):
+        result[i] -= c
+    return result
+
+def _mul_unbalanced(a: list, b: list):
+    """
+    Multiplies a long list `a` by a much shorter list `b`
+    by cutting `a` into chunks the size of `b`.
+    This keeps the splitting algorithms working on
+    operands of (nearly) equal length.
+    """
+    k = len(b)
+    result = [0] * (len(a) + k - 1)
+    for start in range(0, len(a), k):
+        _add_into(result, mul_coeffs(a[start:start+k], b), start)
+    return result
+
+def mul_karatsuba(a: list, b: list):
+    """
+    Karatsuba multiplication of two coefficient lists:
+    three half-size products instead of four.
+    """
+    n = max(len(a), len(b))
+    half = (n + 1) // 2
+    a0, a1 = a[:half], a[half:]
+    b0, b1 = b[:half], b[half:]
+    # a = a0 + a1 x^half, b likewise
+    # a*b = z0 + (z1 - z0 - z2) x^half + z2 x^(2*half)
+    z0 = mul_coeffs(a0, b0)
+    # the high halves may be empty when the operands are lopsided
+    z2 = mul_coeffs(a1, b1) if a1 and b1 else []
+    z1 = mul_coeffs(_add_lists(a0, a1), _add_lists(b0, b1))
+    middle = _sub_lists(_sub_lists(z1, z0), z2)
+    result = [0] * (len(a) + len(b) - 1)
+    _add_into(result, z0)
+    _add_into(result, middle[:len(result) - half], half)
+    _add_into(result, z2, 2 * half)
+    return result
+
+def mul_toom3(a: list, b: list):
+    """
+    Toom-3 (Toom-Cook, 3-way) multiplication of two coefficient lists:
+    five third-size products instead of nine.
+    Evaluates at 0, 1, -1, -2 and infinity, and interpolates
+    with Bodrato's sequence. All divisions are exact over the integers.
+    """
+    n = max(len(a), len(b))
+    third = (n + 2) // 3
+    a0, a1, a2 = a[:third], a[third:2*third], a[2*third:]
+    b0, b1, b2 = b[:third], b[third:2*third], b[2*third:]
+
+    def evaluate(p0, p1, p2):
+        # values at 0, 1, -1, -2, infinity
+        p02 = _add_lists(p0, p2)
+        v1 = _add_lists(p02, p1)
+        vm1 = _sub_lists(p02, p1)
+        # p(-2) = 2*(p(-1) + p2) - p0
+        vm2 = _sub_lists([2 * c for c in _add_lists(vm1, p2)], p0)
+        return p0, v1, vm1, vm2, p2
+
+    ea = evaluate(a0, a1, a2)
+    eb = evaluate(b0, b1, b2)
+    # pointwise products; the last operand pair may be empty
+    r0, r1, rm1, rm2, rinf = [mul_coeffs(x, y) if x and y else []
+                              for x, y in zip(ea, eb)]
+
+    # interpolation (Bodrato)
+    s3 = [c // 3 for c in _sub_lists(rm2, r1)]
+    s1 = [c // 2 for c in _sub_lists(r1, rm1)]
+    s2 = _sub_lists(rm1, r0)
+    s3 = _add_lists([c // 2 for c in _sub_lists(s2, s3)],
+                    [2 * c for c in rinf])
+    s2 = _sub_lists(_add_lists(s2, s1), rinf)
+    s1 = _sub_lists(s1, s3)
+
+    result = [0] * (len(a) + len(b) - 1)
+    for coeffs, shift in ((r0, 0), (s1, third), (s2, 2 * third),
+                          (s3, 3 * third), (rinf, 4 * third)):
+        # high-order padding of the intermediate lists is all zeroes
+        _add_into(result, coeffs[:len(result) - shift], shift)
+    return result
+
+def mul_coeffs(a: list, b: list):
+    """
+    Multiplies two coefficient lists, choosing the splitting algorithm
+    by the size of the shorter operand.
+    Returns an unreduced coefficient list of length len(a) + len(b) - 1.
+    Works with arbitrary (even negative) integer coefficients.
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    short = len(b)
+    if short < KARATSUBA_THRESHOLD:
+        return mul_schoolbook(a, b)
+    # very lopsided operands: split the long one first
+    if 2 * short <= len(a):
+        return _mul_unbalanced(a, b)
+    if short < TOOM3_THRESHOLD:
+        return mul_karatsuba(a, b)
+    return mul_toom3(a, b)
+
+## Kronecker substitution
+
+# a coefficient list [c0, c1, ...] is packed into the integer
+# c0 + c1 * 2^k + c2 * 2^(2k) + ..., i.e. the polynomial evaluated at 2^k.
+# if the slots are wide enough that no product coefficient overflows,
+# one big-integer multiply does the whole convolution in C.
+# slots are whole bytes so that packing and unpacking is a bytes
+# conversion rather than a Python loop over shifts.
+
+# typecodes for array-based packing, by item size in bytes
+_SLOT_TYPECODES = {array(t).itemsize: t for t in "QLIHB"}
+
+def _slot_bytes(bound: int):
+    """
+    Number of bytes per slot needed to hold values up to `bound`.
+    Rounded up to a size `array` can handle natively when possible.
+    """
+    nbytes = (bound.bit_length() + 7) // 8
+    for size in sorted(_SLOT_TYPECODES):
+        if nbytes <= size:
+            return size
+    return nbytes
+
+def _kron_pack(a: list, nbytes: int):
+    """
+    Packs a list (or storage array) of nonnegative coefficients
+    into an integer, `nbytes` bytes per coefficient.
+    """
+    if isinstance(a, array) and a.itemsize <= nbytes:
+        # widen the storage array bytewise: the bytes of each
+        # coefficient go to the low end of its slot
+        if sys.byteorder == "big":
+            a = array(a.typecode, a)
+            a.byteswap()
+        raw = a.tobytes()
+        size = a.itemsize
+        buf = bytearray(len(a) * nbytes)
+        for k in range(size):
+            buf[k::nbytes] = raw[k::size]
+        return int.from_bytes(buf, "little")
+    if nbytes in _SLOT_TYPECODES:
+        buf = array(_SLOT_TYPECODES[nbytes], a)
+        if sys.byteorder == "big":
+            buf.byteswap()
+        return int.from_bytes(buf.tobytes(), "little")
+    return int.from_bytes(b"".join(c.to_bytes(nbytes, "little")
+                                   for c in a), "little")
+
+def _kron_unpack(value: int, length: int, nbytes: int):
+    """
+    Inverse of _kron_pack: splits `value` into `length` coefficients.
+    """
+    raw = value.to_bytes(length * nbytes, "little")
+    if nbytes in _SLOT_TYPECODES:
+        buf = array(_SLOT_TYPECODES[nbytes])
+        buf.frombytes(raw)
+        if sys.byteorder == "big":
+            buf.byteswap()
+        return buf.tolist()
+    return [int.from_bytes(raw[i:i+nbytes], "little")
+            for i in range(0, len(raw), nbytes)]
+
+def mul_kronecker(a: list, b: list):
+    """
+    Multiplies two lists of coefficients in 0..FCH-1
+    via Kronecker substitution.
+    Returns an unreduced coefficient list of length len(a) + len(b) - 1.
+    """
+    # largest possible coefficient of the product
+    bound = min(len(a), len(b)) * (FCH - 1) ** 2
+    nbytes = _slot_bytes(bound)
+    product = _kron_pack(a, nbytes) * _kron_pack(b, nbytes)
+    return _kron_unpack(product, len(a) + len(b) - 1, nbytes)
+
+def sqr_kronecker(a: list):
+    """
+    Squares a list of coefficients in 0..FCH-1 via Kronecker substitution.
+    """
+    nbytes = _slot_bytes(len(a) * (FCH - 1) ** 2)
+    packed = _kron_pack(a, nbytes)
+    return _kron_unpack(packed * packed, 2 * len(a) - 1, nbytes)
+
+## number-theoretic transform
+
+# NTT-friendly primes q = c * 2^k + 1 with a primitive root g,
+# stored as (q, k, g). sorted by k, descending:
+# a transform of length 2^k works modulo all primes up to and
+# including the first one whose k is too small.
+NTT_PRIMES = [(2013265921, 27, 31), (469762049, 26, 3),
+              (1811939329, 26, 13), (167772161, 25, 3),
+              (2113929217, 25, 5), (1107296257, 25, 10),
+              (1711276033, 25, 29), (754974721, 24, 11),
+              (1224736769, 24, 3), (998244353, 23, 3)]
+
+# bit-reversal permutations, cached by transform length
+_bitrev_cache = {}
+
+def _bitrev(n: int):
+    """
+    Bit-reversal permutation of range(n), n a power of 2.
+    """
+    if n not in _bitrev_cache:
+        rev = [0]
+        while len(rev) < n:
+            rev = [2 * r for r in rev] + [2 * r + 1 for r in rev]
+        _bitrev_cache[n] = rev
+    return _bitrev_cache[n]
+
+def _ntt(a: list, q: int, g: int, invert: bool = False):
+    """
+    Iterative radix-2 NTT of `a` (length a power of 2) modulo prime q,
+    with primitive root g. Returns a new list.
+    The inverse transform includes the division by len(a).
+    """
+    n = len(a)
+    a = [a[r] for r in _bitrev(n)]
+    length = 2
+    while length <= n:
+        half = length // 2
+        w = pow(g, (q - 1) // length, q)
+        if invert:
+            w = pow(w, -1, q)
+        twiddles = [1] * half
+        for k in range(1, half):
+            twiddles[k] = twiddles[k-1] * w % q
+        if half < n // length:
+            # few twiddles, many blocks:
+            # process all butterflies sharing a twiddle at once
+            for k, wk in enumerate(twiddles):
+                lo = a[k::length]
+                hi = [h * wk % q for h in a[k+half::length]]
+                a[k::length] = [(u + v) % q for u, v in zip(lo, hi)]
+                a[k+half::length] = [(u - v) % q for u, v in zip(lo, hi)]
+        else:
+            # few blocks, many twiddles: one block at a time
+            for start in range(0, n, length):
+                mid = start + half
+                lo = a[start:mid]
+                hi = [h * wk % q
+                      for h, wk in zip(a[mid:start+length], twiddles)]
+                a[start:mid] = [(u + v) % q for u, v in zip(lo, hi)]
+                a[mid:start+length] = [(u - v) % q for u, v in zip(lo, hi)]
+        length *= 2
+    if invert:
+        n_inv = pow(n, -1, q)
+        a = [c * n_inv % q for c in a]
+    return a
+
+def _ntt_primes_for(bound: int, size: int):
+    """
+    Picks NTT primes whose product exceeds `bound`
+    and which all support transforms of length `size`.
+    Returns None if there are not enough of them.
+    """
+    chosen = []
+    modulus = 1
+    for q, k, g in NTT_PRIMES:
+        if modulus > bound:
+            break
+        if size > 2 ** k:
+            return None
+        chosen.append((q, g))
+        modulus *= q
+    if modulus <= bound:
+        return None
+    return chosen
+
+def mul_ntt(a: list, b: list):
+    """
+    Multiplies two lists of coefficients in 0..FCH-1 via the NTT:
+    convolves modulo as many NTT primes as needed to represent
+    every product coefficient exactly, then glues the residues
+    back together with the Chinese remainder theorem.
+    Falls back to Kronecker substitution if the product is too large
+    for the available primes.
+    Returns an unreduced coefficient list of length len(a) + len(b) - 1.
+    """
+    length = len(a) + len(b) - 1
+    size = 1
+    while size < length:
+        size *= 2
+    bound = min(len(a), len(b)) * (FCH - 1) ** 2
+    primes = _ntt_primes_for(bound, size)
+    if primes is None:
+        return mul_kronecker(a, b)
+    padded_a = a + [0] * (size - len(a))
+    padded_b = b + [0] * (size - len(b))
+    residues = []
+    for q, g in primes:
+        fa = _ntt(padded_a, q, g)
+        # squaring: transform once
+        fb = fa if a is b else _ntt(padded_b, q, g)
+        pointwise = [x * y % q for x, y in zip(fa, fb)]
+        residues.append(_ntt(pointwise, q, g, invert=True)[:length])
+    # CRT, accumulating one prime at a time (Garner-style)
+    result = residues[0]
+    modulus = primes[0][0]
+    for (q, g), res in zip(primes[1:], residues[1:]):
+        # x = result + modulus * t, with t = (res - result) / modulus mod q
+        m_inv = pow(modulus, -1, q)
+        result = [x + modulus * ((r - x) * m_inv % q)
+                  for x, r in zip(result, res)]
+        modulus *= q
+    return result
+
+## backend selection
+
+# which algorithm Poly.__mul__ and Poly.square use:
+# "auto" picks by operand size (see thresholds),
+# anything else in MUL_BACKENDS forces that algorithm.
+MUL_BACKENDS = ["auto", "schoolbook", "karatsuba", "toom3",
+                "kronecker", "ntt"]
+MUL_BACKEND = "auto"
+# in "auto" mode, Kronecker substitution is used once the shorter
+# operand has at least this many coefficients
+KRONECKER_THRESHOLD = 8
+# likewise for the NTT. None means "auto" never picks it:
+# in pure Python the transforms lose to CPython's C-level big-int
+# multiply at every size (see benchmarks.py), but the path is here
+# for interpreters where that does not hold.
+NTT_THRESHOLD = None
+
+def set_mul_backend(name: str):
+    """
+    Selects the multiplication backend. See MUL_BACKENDS.
+    """
+    global MUL_BACKEND
+    if name not in MUL_BACKENDS:
+        raise ValueError(f"Unknown multiplication backend '{name}' -- "
+                         "expected one of: " + ", ".join(MUL_BACKENDS))
+    MUL_BACKEND = name
+
+def _as_lists(a, b):
+    # the splitting algorithms and the NTT concatenate and pad,
+    # so they want lists; typed storage arrays are copied once here.
+    # keeps `a is b` intact, the NTT uses it to detect squaring
+    squaring = a is b
+    if not isinstance(a, list):
+        a = list(a)
+    if squaring:
+        return a, a
+    if not isinstance(b, list):
+        b = list(b)
+    return a, b
+
+def mul_reduced(a: list, b: list):
+    """
+    Multiplies two lists (or storage arrays) of coefficients
+    in 0..FCH-1 with the currently selected backend.
+    Kronecker substitution and the schoolbook loop read arrays
+    as they are; the other backends get lists.
+    Returns an unreduced coefficient list.
+    """
+    backend = MUL_BACKEND
+    short = min(len(a), len(b))
+    if backend == "auto":
+        if NTT_THRESHOLD is not None and short >= NTT_THRESHOLD:
+            return mul_ntt(*_as_lists(a, b))
+        if short >= KRONECKER_THRESHOLD:
+            return mul_kronecker(a, b)
+        return mul_coeffs(*_as_lists(a, b))
+    # the splitting algorithms need something to split
+    if backend == "schoolbook" or short < 3:
+        return mul_schoolbook(a, b)
+    if backend == "karatsuba":
+        return mul_karatsuba(*_as_lists(a, b))
+    if backend == "toom3":
+        return mul_toom3(*_as_lists(a, b))
+    if backend == "ntt":
+        return mul_ntt(*_as_lists(a, b))
+    return mul_kronecker(a, b)
+
+def sqr_reduced(a: list):
+    """
+    Squares a list of coefficients in 0..FCH-1
+    with the currently selected backend.
+    """
+    backend = MUL_BACKEND
+    if backend == "auto":
+        if NTT_THRESHOLD is not None and len(a) >= NTT_THRESHOLD:
+            backend = "ntt"
+        elif len(a) >= KRONECKER_THRESHOLD:
+            backend = "kronecker"
+    if backend == "kronecker":
+        return sqr_kronecker(a)
+    # everything else either has no special squaring,
+    # or (NTT) detects it from `a is b`
+    return mul_reduced(a, a)
+
+## division
+
+# quotients with fewer coefficients than this are computed
+# by schoolbook long division; longer ones by Newton iteration
+NEWTON_DIV_THRESHOLD = 32
+
+def divmod_classical(a: list, b: list):
+    """
+    Schoolbook long division of coefficient list `a` by `b`.
+    Both must be normalized (no leading zeroes), with len(a) >= len(b).
+    Returns (quotient, remainder) as lists reduced mod FCH;
+    the remainder has exactly len(b) - 1 entries (possibly zero).
+    """
+    p = FCH
+    n = len(b) - 1
+    lead_inv = pow(b[-1], -1, p)
+    rem = list(a)
+    quo = [0] * (len(a) - n)
+    for i in range(len(a) - 1, n - 1, -1):
+        c = rem[i] * lead_inv % p
+        if c == 0:
+            continue
+        quo[i - n] = c
+        start = i - n
+        # cancel the leading term: rem -= c * x^start * b
+        rem[start:i] = [(r - c * d) % p
+                        for r, d in zip(rem[start:i], b)]
+    return quo, rem[:n]
+
+def series_inverse(f: list, k: int):
+    """
+    Inverse of the power series `f` modulo x^k, by Newton iteration:
+    g <- g * (2 - f * g), doubling the precision every step.
+    `f` must have a nonzero constant term.
+    Returns a list of exactly k coefficients reduced mod FCH.
+    """
+    p = FCH
+    g = [pow(f[0], -1, p)]
+    prec = 1
+    while prec < k:
+        prec = min(2 * prec, k)
+        # e = 2 - f * g mod x^prec
+        fg = mul_reduced(f[:prec], g)[:prec]
+        e = [-c % p for c in fg]
+        e[0] = (e[0] + 2) % p
+        g = [c % p for c in mul_reduced(g, e)[:prec]]
+    return g + [0] * (k - len(g))
+
+def divmod_newton(a: list, b: list, rev_inv: list = None):
+    """
+    Fast division of coefficient list `a` by `b`, same contract as
+    divmod_classical, in time proportional to a multiplication.
+
+    With m = deg a, n = deg b and k = m - n + 1, reversing coefficients
+    turns a = q * b + r into rev(a) = rev(q) * rev(b) mod x^k,
+    so rev(q) is rev(a) times the power series inverse of rev(b).
+
+    rev_inv: optional precomputed series_inverse(rev(b), k')
+    with k' >= k, e.g. cached by a modulus object.
+    """
+    p = FCH
+    n = len(b) - 1
+    k = len(a) - n
+    if rev_inv is None or len(rev_inv) < k:
+        rev_inv = series_inverse(b[::-1], k)
+    q_rev = mul_reduced(a[::-1][:k], rev_inv[:k])[:k]
+    quo = [c % p for c in reversed(q_rev)]
+    quo = [0] * (k - len(quo)) + quo
+    # r = a - q * b; only the low n coefficients survive
+    bq = mul_reduced(b[:n], quo[:n]) if n else []
+    rem = [(x - y) % p for x, y in zip(a[:n], bq + [0] * n)]
+    return quo, rem
+
+def divmod_coeffs(a: list, b: list, rev_inv: list = None):
+    """
+    Divides normalized coefficient list `a` by `b` (nonzero),
+    picking schoolbook or Newton division by quotient size.
+    Returns (quotient, remainder) as lists reduced mod FCH.
+    (In characteristic 2, as arrays from the bit-packed division.)
+    """
+    if FCH == 2:
+        quo, rem = gf2.divmod_bits(gf2.from_coeffs(a), gf2.from_coeffs(b))
+        return gf2.to_coeffs(quo), gf2.to_coeffs(rem)
+    n = len(b) - 1
+    if len(a) <= n:
+        return [0], list(a)
+    if len(a) - n < NEWTON_DIV_THRESHOLD:
+        return divmod_classical(a, b)
+    return divmod_newton(a, b, rev_inv)
+
+class PolyModulus():
+    """
+    A polynomial prepared for repeated reduction modulo itself.
+
+    Caches the monic associate, the inverse of the leading coefficient
+    and the power series inverse of the reversed monic polynomial
+    (the Barrett-style data used by divmod_newton), so that reducing
+    products of reduced polynomials costs two multiplications and
+    no inversions.
+    In characteristic 2 it keeps the bit-packed modulus instead,
+    and reduces by shift-and-XOR.
+    """
+    def __init__(self, poly):
+        if poly.degree() == -1:
+            raise ZeroDivisionError
+        if poly.degree() == 0:
+            raise ArithmeticError("Cannot reduce modulo a constant polynomial!")
+        self.poly = poly
+        self.n = poly.degree()
+        self.lead_inv = pow(poly.coeffs[-1], -1, FCH)
+        self.monic = poly.scale(self.lead_inv)
+        if FCH == 2:
+            self.bits = gf2_bits(self.monic)
+            self.rev_inv = None
+            return
+        # products of two reduced polynomials have quotients
+        # of at most n - 1 coefficients; larger inputs grow this lazily
+        self.rev_inv = series_inverse(self.monic.coeffs[::-1], self.n)
+
+    def __str__(self):
+        return str(self.poly)
+
+    def reduce_coeffs(self, cfs: list):
+        """
+        Reduces a normalized coefficient list modulo the polynomial.
+        Returns a coefficient list of at most n entries.
+        """
+        n = self.n
+        if len(cfs) <= n:
+            return cfs
+        if FCH == 2:
+            return gf2.to_coeffs(gf2.mod_bits(gf2.from_coeffs(cfs), self.bits))
+        k = len(cfs) - n
+        if k < NEWTON_DIV_THRESHOLD:
+            return divmod_classical(cfs, self.monic.coeffs)[1]
+        if k > len(self.rev_inv):
+            self.rev_inv = series_inverse(self.monic.coeffs[::-1], k)
+        return divmod_newton(cfs, self.monic.coeffs, self.rev_inv)[1]
+
+    def reduce(self, a):
+        """
+        Computes a % self.poly.
+        """
+        return Poly(self.reduce_coeffs(a.coeffs))
+
+    def mulmod(self, a, b):
+        """
+        Computes (a * b) % self.poly.
+        `a` and `b` should already be reduced.
+        """
+        product = a * b
+        return Poly(self.reduce_coeffs(product.coeffs))
+
+    def sqrmod(self, a):
+        """
+        Computes (a * a) % self.poly.
+        `a` should already be reduced.
+        """
+        return Poly(self.reduce_coeffs(a.square().coeffs))
+
+    def mul_x(self, a):
+        """
+        Computes (x * a) % self.poly for a reduced `a`:
+        a shift followed by at most one cancellation step.
+        """
+        p = FCH
+        n = self.n
+        shifted = [0, *a.coeffs]
+        if len(shifted) <= n:
+            return Poly(shifted)
+        # cancel the x^n term with the monic modulus
+        top = shifted[n]
+        return Poly([(s - top * m) % p
+                     for s, m in zip(shifted[:n], self.monic.coeffs)])
+
+    def powmod(self, a, exponent: int):
+        """
+        Computes (a ** exponent) % self.poly by square-and-multiply.
+        When `a` is x, the multiplication steps are just shifts.
+        """
+        if exponent < 0:
+            raise ValueError(f"Cannot raise a polynomial to power {exponent}.")
+        if exponent == 0:
+            return Poly([1])
+        if FCH == 2:
+            # the whole ladder stays bit-packed
+            return from_gf2_bits(gf2.powmod_bits(gf2_bits(a), exponent,
+                                                 self.bits))
+        base = self.reduce(a)
+        is_x = base.degree() == 1 and base.coeffs[0] == 0 and base.coeffs[1] == 1
+        result = base
+        # left-to-right binary method; the leading bit is `result` itself
+        for bit in bin(exponent)[3:]:
+            result = self.sqrmod(result)
+            if bit == "1":
+                if is_x:
+                    result = self.mul_x(result)
+                else:
+                    result = self.mulmod(result, base)
+        return result
+
 def monomial(coeff: int=1, deg: int=0):
     """
     Creates a monomial equal to coeff * x^deg. Auxiliary.
@@ -378,20 +1191,81 @@ def constant(value: int):
 def x_power_modulo(deg: int, f):
     """
     Creates a polynomial congruent to x^deg modulo f.
+    `f` may be a Poly or a PolyModulus; pass the latter
+    when reducing modulo the same polynomial repeatedly.
     """
-    # repeated squaring
-    
-    # 1 mod anything is 1
-    if deg == 0:
-        return constant(1)
-    if deg == 1:
-        return monomial(deg=1) % f
-    k = deg // 2
-    temp = x_power_modulo(k, f)
-    result = (temp * temp) % f
-    if deg % 2 == 1:
-        result = (result * monomial(deg=1)) % f
-    return result
+    # repeated squaring, with the multiplications by x done as shifts
+    if not isinstance(f, PolyModulus):
+        f = PolyModulus(f)
+    return f.powmod(monomial(deg=1), deg)
+
+# modular composition
+# g(h) mod f by Brent and Kung's baby-step/giant-step method:
+# with m about sqrt(deg g), cut g into blocks g_0, g_1, ... of m
+# coefficients each, so that g(h) = sum of g_i(h) * (h^m)^i.
+# the baby steps are the powers h^0..h^m mod f; every g_i(h) is
+# then a linear combination of them, done on Kronecker-packed ints
+# so it costs no modular multiplications at all.
+# the giant steps are Horner's rule in h^m.
+# in total about 2 sqrt(deg g) multiplications modulo f,
+# against deg g for plain Horner.
+# the baby steps depend only on h, so a CompositionTable keeps them
+# for composing many g with the same inner h: each composition
+# after the first then costs only the sqrt(deg g) giant steps.
+
+class CompositionTable():
+    """
+    The Brent-Kung baby steps h^0..h^m mod f,
+    for computing g(h) mod f for many g.
+    `degree` is the largest degree of g the table is sized for;
+    by default deg f - 1, i.e. any reduced g.
+    """
+    def __init__(self, h, f, degree: int = None):
+        modulus = f if isinstance(f, PolyModulus) else PolyModulus(f)
+        if degree is None:
+            degree = modulus.n - 1
+        self.modulus = modulus
+        self.m = m = isqrt(max(degree, 1)) + 1
+        h = modulus.reduce(h)
+        powers = [constant(1), h]
+        for _ in range(m - 1):
+            powers.append(modulus.mulmod(powers[-1], h))
+        # every block is a sum of m products of two residues
+        self.nbytes = _slot_bytes(m * (FCH - 1) ** 2)
+        self.packed = [_kron_pack(list(power.coeffs), self.nbytes)
+                       for power in powers[:m]]
+        self.h_m = powers[m]
+
+    def compose(self, g):
+        """
+        Computes g(h) mod f.
+        """
+        if g.degree() <= 0:
+            return g.__copy__()
+        modulus = self.modulus
+        m = self.m
+        g_cfs = list(g.coeffs)
+        blocks = []
+        for start in range(0, len(g_cfs), m):
+            acc = 0
+            for c, power in zip(g_cfs[start:start + m], self.packed):
+                acc += c * power
+            blocks.append(Poly(_kron_unpack(acc, modulus.n, self.nbytes)))
+        # giant steps
+        result = blocks[-1]
+        for block in reversed(blocks[:-1]):
+            result = modulus.mulmod(result, self.h_m) + block
+        return result
+
+def compose_mod(g, h, f):
+    """
+    Computes g(h) mod f.
+    `f` may be a Poly or a PolyModulus; to compose many g
+    with the same h, build a CompositionTable once instead.
+    """
+    if g.degree() <= 0:
+        return g.__copy__()
+    return CompositionTable(h, f, g.degree()).compose(g)
 
 def lincomb(weights: list, polys: list):
     """
@@ -404,6 +1278,15 @@ def lincomb(weights: list, polys: list):
     if len(weights) != len(polys):
         raise ValueError("Bad linear combination -- weight and polynomial count don't match.")
     # if we are here, len(weights) == len(polys)
+    longest = max([len(poly.coeffs) for poly in polys], default=0)
+    if numpy_usable(longest):
+        # accumulate in one vector instead of a Poly per term
+        p = FCH
+        acc = np.zeros(longest, dtype=np.int64)
+        for weight, poly in zip(weights, polys):
+            vec = _to_numpy(poly.coeffs)
+            acc[:len(vec)] = (acc[:len(vec)] + (weight % p) * vec) % p
+        return _from_numpy(acc)
     # initialize sum to 0
     total = Poly([0])
     for i in range(len(weights)):
@@ -417,24 +1300,121 @@ def eucdiv(dividend, divisor):
     dividend: Poly
     divisor: Poly
     """
-    quotient = constant(0)
-    remainder = Poly(dividend.coeffs)
     if divisor.is_zero():
         raise ZeroDivisionError
     if divisor.degree() == 0:
-        remainder = remainder.scale(pow(divisor.coeffs[0], -1, FCH))
-        return (remainder, constant(0))
-    leading_coeff = divisor.coeffs[-1]
-    while remainder.degree() >= divisor.degree():
-        # calculate the monomial a*x^n to cancel out the leading term of the dividend
-        # a is quotcoeff, n is remainder.degree() - divisor.degree()
-        quotcoeff = remainder.coeffs[-1] * pow(leading_coeff, -1, FCH)
-        # making the monomial; coeffs are n zeros followed by quotcoeff
-        monom = monomial(coeff = quotcoeff,
-                         deg = remainder.degree()-divisor.degree())
-        quotient = quotient + monom
-        remainder = remainder - divisor * monom
-    return (quotient, remainder)
+        quotient = dividend.scale(pow(divisor.coeffs[0], -1, FCH))
+        return (quotient, constant(0))
+    quotient, remainder = divmod_coeffs(dividend.coeffs, divisor.coeffs)
+    return (Poly(quotient), Poly(remainder))
+
+# half-GCD (Knuth-Schonhage)
+# Euclid's algorithm on (a, b) is a sequence of steps
+#   (r_i-1, r_i) -> (r_i, r_i-1 - q_i r_i)
+# each of which is the 2x2 matrix [[0, 1], [1, -q_i]].
+# the quotients q_i only depend on the top coefficients of r_i-1 and r_i,
+# so the first half of the sequence for (a, b) can be found recursively
+# from a and b with their lower halves chopped off.
+# half_gcd returns the product of those step matrices,
+# which then gets applied to the full-size polynomials in one go.
+# matrices are stored as tuples (m00, m01, m10, m11) of Polys.
+
+# below this degree half_gcd just runs Euclid's steps one by one
+HGCD_THRESHOLD = 64
+
+def _identity_matrix():
+    return (constant(1), constant(0), constant(0), constant(1))
+
+def _matrix_apply(mat, a, b):
+    """
+    Multiplies the column vector (a, b) by `mat`.
+    """
+    m00, m01, m10, m11 = mat
+    return (m00 * a + m01 * b, m10 * a + m11 * b)
+
+def _matrix_mul(left, right):
+    """
+    Product of two 2x2 polynomial matrices.
+    """
+    l00, l01, l10, l11 = left
+    r00, r01, r10, r11 = right
+    return (l00 * r00 + l01 * r10, l00 * r01 + l01 * r11,
+            l10 * r00 + l11 * r10, l10 * r01 + l11 * r11)
+
+def _matrix_step(mat, quotient):
+    """
+    [[0, 1], [1, -quotient]] * mat, i.e. one more Euclidean step.
+    """
+    m00, m01, m10, m11 = mat
+    return (m10, m11, m00 - quotient * m10, m01 - quotient * m11)
+
+def _shift_down(poly, k: int):
+    """
+    poly // x^k
+    """
+    if poly.degree() < k:
+        return constant(0)
+    return Poly(poly.coeff_view(k))
+
+def half_gcd(a, b):
+    """
+    For deg(a) > deg(b), returns the matrix M of the Euclidean steps
+    that take (a, b) to the consecutive remainders (c, d) with
+    deg(c) >= ceil(deg(a)/2) > deg(d).
+    """
+    m = (a.degree() + 1) // 2
+    if b.degree() < m:
+        return _identity_matrix()
+    if a.degree() < HGCD_THRESHOLD:
+        mat = _identity_matrix()
+        while b.degree() >= m:
+            quotient, remainder = eucdiv(a, b)
+            mat = _matrix_step(mat, quotient)
+            a, b = b, remainder
+        return mat
+    # first half: the steps taken by the top halves of a and b
+    mat = half_gcd(_shift_down(a, m), _shift_down(b, m))
+    a, b = _matrix_apply(mat, a, b)
+    if b.degree() < m:
+        return mat
+    # one step by hand to get past the middle
+    quotient, remainder = eucdiv(a, b)
+    mat = _matrix_step(mat, quotient)
+    a, b = b, remainder
+    if b.degree() < m:
+        return mat
+    # second half: again from the top coefficients only
+    k = 2 * m - a.degree()
+    second = half_gcd(_shift_down(a, k), _shift_down(b, k))
+    return _matrix_mul(second, mat)
+
+def _monic_gcd_tuple(gcd, coe1, coe2):
+    # QoL: make the GCD monic, scaling the coefficients along with it
+    leadcoe_inv = pow(gcd.coeffs[-1], -1, FCH)
+    return (gcd.scale(leadcoe_inv),
+            coe1.scale(leadcoe_inv),
+            coe2.scale(leadcoe_inv))
+
+def poly_gcd(poly1, poly2):
+    """
+    Monic greatest common divisor of `poly1` and `poly2`,
+    without the Bezout coefficients.
+    Only the current pair of remainders is kept around.
+    gcd(0, 0) is 0.
+    """
+    if FCH == 2:
+        return from_gf2_bits(gf2.gcd_bits(gf2_bits(poly1), gf2_bits(poly2)))
+    a, b = poly1, poly2
+    while not b.is_zero():
+        if a.degree() > b.degree() >= HGCD_THRESHOLD:
+            # jump halfway down the remainder sequence
+            a, b = _matrix_apply(half_gcd(a, b), a, b)
+            if b.is_zero():
+                break
+        a, b = b, eucdiv(a, b)[1]
+    if a.is_zero():
+        return constant(0)
+    return a.monify()
 
 def ext_euclid_algo(poly1, poly2):
     """
@@ -468,39 +1448,179 @@ def ext_euclid_algo(poly1, poly2):
 
     # so now that the polynomials are at least linear
     # we can actually start cooking
-    # the number of EEA iterations is at most this much,
-    # since the degree goes down by 1 every time:
-    iters = min(poly1.degree(), poly2.degree()) + 1
-
-    # initialize these lists to have the required length
-    # because messing with appends failed spectacularly
-    rems = [poly1.__copy__(), poly2.__copy__()] + [constant(0)] * iters
-    quots = [constant(0)] * (iters+2)
-    coe1 = [constant(1), constant(0)] + [constant(0)] * iters
-    coe2 = [constant(0), constant(1)] + [constant(0)] * iters
-    
-    # recurrence relations can actually be written directly in code now
-    for i in range(1, len(rems)-1):
-        # if current remainder is 0, we are done
-        if rems[i].is_zero():
-            break
-        quots[i], rems[i+1] = eucdiv(rems[i-1], rems[i])
-        coe1[i+1] = coe1[i-1] - quots[i] * coe1[i]
-        coe2[i+1] = coe2[i-1] - quots[i] * coe2[i]
-
-    # so now we have our rems, we need to find the last nonzero one
-    k = len(rems)-1
-    while rems[k].is_zero():
-        k -= 1
+    # `mat` is the product of all the steps so far, so that
+    # (a, b) == mat * (poly1, poly2) at all times;
+    # its top row holds the Bezout coefficients of a
+    a, b = poly1, poly2
+    mat = _identity_matrix()
+    while not b.is_zero():
+        if a.degree() > b.degree() >= HGCD_THRESHOLD:
+            step = half_gcd(a, b)
+            a, b = _matrix_apply(step, a, b)
+            mat = _matrix_mul(step, mat)
+            if b.is_zero():
+                break
+        quotient, remainder = eucdiv(a, b)
+        mat = _matrix_step(mat, quotient)
+        a, b = b, remainder
 
-    # QoL: make the GCD monic
     # given that neither poly1 nor poly2 is 0,
     # the GCD won't be either
-    gcd, coe1, coe2 = rems[k], coe1[k], coe2[k]
-    leadcoe_inv = pow(gcd.coeffs[-1],-1,FCH)
+    return _monic_gcd_tuple(a, mat[0], mat[1])
 
-    gcd = gcd.scale(leadcoe_inv)
-    coe1 = coe1.scale(leadcoe_inv)
-    coe2 = coe2.scale(leadcoe_inv)
-    
-    return (gcd, coe1, coe2)
+# multipoint evaluation
+# evaluating f at k points one by one costs O(k deg f).
+# instead, the linear factors (x - u) go into a subproduct tree:
+# every node is the product of its two children.
+# since f mod (x - u) == f(u), and the remainder modulo a node
+# can be taken from the remainder modulo its parent,
+# f is pushed down the tree with one fast division per node.
+# the bottom level covers blocks of MULTIEVAL_LEAF points,
+# which are finished off by Horner's rule.
+
+MULTIEVAL_LEAF = 32
+
+def _horner(cfs, x: int):
+    """
+    Value of the coefficient list `cfs` at x, by Horner's rule.
+    """
+    result = 0
+    for c in reversed(cfs):
+        result = (result * x + c) % FCH
+    return result
+
+def _linear_product(points):
+    """
+    Coefficient list of the product of (x - u) over `points`.
+    """
+    cfs = [1]
+    for u in points:
+        # times x, then minus u times the old coefficients
+        shifted = [0] + cfs
+        for i, c in enumerate(cfs):
+            shifted[i] = (shifted[i] - u * c) % FCH
+        cfs = shifted
+    return cfs
+
+def subproduct_tree(points: list):
+    """
+    Levels of the subproduct tree over `points`, bottom level first.
+    The bottom level holds the products of (x - u) over consecutive
+    blocks of MULTIEVAL_LEAF points, each level above multiplies
+    neighbouring pairs (an odd one out moves up as is),
+    and the top level is just the product over all points.
+    Nodes are coefficient lists.
+    """
+    level = [_linear_product(points[i:i + MULTIEVAL_LEAF])
+             for i in range(0, len(points), MULTIEVAL_LEAF)]
+    tree = [level]
+    while len(level) > 1:
+        parents = []
+        for i in range(0, len(level) - 1, 2):
+            parents.append([c % FCH
+                            for c in mul_reduced(level[i], level[i+1])])
+        if len(level) % 2 == 1:
+            parents.append(level[-1])
+        level = parents
+        tree.append(level)
+    return tree
+
+def _remainder(a, b: list):
+    # remainder of `a` modulo the monic tree node `b`
+    if len(a) < len(b):
+        return a
+    return divmod_coeffs(a, b)[1]
+
+def _tree_eval(cfs: list, points: list, tree: list = None):
+    # evaluation at `points` down one subproduct tree
+    if tree is None:
+        tree = subproduct_tree(points)
+    # walk down the tree, keeping cfs mod every node of the level
+    rems = [_remainder(cfs, tree[-1][0])]
+    for level in reversed(tree[:-1]):
+        rems = [_remainder(rems[i // 2], node)
+                for i, node in enumerate(level)]
+    values = []
+    for i, rem in enumerate(rems):
+        for u in points[i * MULTIEVAL_LEAF:(i + 1) * MULTIEVAL_LEAF]:
+            values.append(_horner(rem, u))
+    return values
+
+def multipoint_eval(poly, points):
+    """
+    Values of `poly` at every integer in `points`, in the same order.
+    """
+    points = [u % FCH for u in points]
+    if len(points) <= MULTIEVAL_LEAF:
+        return [poly.peval(u) for u in points]
+    # nodes of higher degree than poly leave it as it is,
+    # so there is no point building trees much taller than that:
+    # many points get split into chunks of about deg(poly) each
+    chunk = MULTIEVAL_LEAF
+    while chunk <= poly.degree():
+        chunk *= 2
+    cfs = list(poly.coeffs)
+    values = []
+    for start in range(0, len(points), chunk):
+        values += _tree_eval(cfs, points[start:start + chunk])
+    return values
+
+# interpolation
+# Lagrange's formula for the polynomial through (x_i, y_i) is
+#   f = sum of y_i / M'(x_i) * M / (x - x_i),  M = product of (x - x_i)
+# the weights 1 / M'(x_i) come from one multipoint evaluation of M',
+# and the sum is put together bottom-up on the same subproduct tree:
+# a node's sum is left sum * right product + right sum * left product.
+
+def _divide_linear(cfs: list, u: int):
+    """
+    Quotient of the coefficient list `cfs` by (x - u),
+    by synthetic division; the remainder is dropped.
+    """
+    quotient = [0] * (len(cfs) - 1)
+    carry = 0
+    for k in range(len(cfs) - 1, 0, -1):
+        carry = (cfs[k] + u * carry) % FCH
+        quotient[k-1] = carry
+    return quotient
+
+def interpolate(xs: list, ys: list):
+    """
+    The polynomial of degree < len(xs) taking value ys[i] at xs[i].
+    The xs must be distinct modulo FCH.
+    """
+    if len(xs) != len(ys):
+        raise ValueError("Bad interpolation -- point and value "
+                         "count don't match.")
+    if len(xs) == 0:
+        return constant(0)
+    xs = [x % FCH for x in xs]
+    tree = subproduct_tree(xs)
+    root = tree[-1][0]
+    # M'(x_i), with M the product over all points
+    deriv = [(i * c) % FCH for i, c in enumerate(root)][1:]
+    weights = _tree_eval(deriv, xs, tree)
+    if 0 in weights:
+        raise ValueError("Cannot interpolate -- "
+                         "points are not distinct.")
+    coeffs = [y * pow(w, -1, FCH) % FCH for y, w in zip(ys, weights)]
+    # bottom level: sum of c_i * node / (x - x_i) inside each block
+    sums = []
+    for i, node in enumerate(tree[0]):
+        start = i * MULTIEVAL_LEAF
+        total = [0] * (len(node) - 1)
+        for j in range(start, start + len(node) - 1):
+            for k, c in enumerate(_divide_linear(node, xs[j])):
+                total[k] += coeffs[j] * c
+        sums.append([c % FCH for c in total])
+    # and up the tree
+    for below, level in zip(tree, tree[1:]):
+        merged = []
+        for i in range(0, len(below) - 1, 2):
+            left = mul_reduced(sums[i], below[i+1])
+            right = mul_reduced(sums[i+1], below[i])
+            merged.append([c % FCH for c in _add_lists(left, right)])
+        if len(below) % 2 == 1:
+            merged.append(sums[-1])
+        sums = merged
+    return Poly(sums[0])
@@ -2,10 +2,20 @@
 
 # contains logic for testing polynomial properties
 # irreducibility and primitivity
-# eventually also factorization
+# as well as factorization
+
+import multiprocessing
+import os
+import random
+import threading
+from collections import OrderedDict, deque
+from functools import wraps
+from math import isqrt
 
 import polynomial as pol
 import auxiliaries as aux
+import gf2poly as gf2
+import fplinalg
 
 def xqpower(n: int, f):
     """
@@ -13,7 +23,14 @@ def xqpower(n: int, f):
     Used for x^(FCH^n) - x; the -x is added beyond this function.
     (i.e. (x^(FCH^n) - x) mod f is
     `xqpower(n, f) - pol.monomial(deg=1)`
+
+    `f` may be a Poly or a pol.PolyModulus.
     """
+    if isinstance(f, pol.PolyModulus):
+        modulus = f
+        f = modulus.poly
+    else:
+        modulus = None
     # we're not gonna call this on constants or linears
     # but that case needs to be handled anyway
     if f.degree() <= 0:
@@ -27,11 +44,89 @@ def xqpower(n: int, f):
         # x^(FCH^0) = x^1
         return pol.monomial(coeff=1, deg=1)
 
-    result = pol.monomial(coeff=1, deg=1)
-    for i in range(n):
-        # worst-case space complexity is FCH * f.degree()
-        result = (result ** pol.FCH) % f
-    return result
+    if pol.FCH == 2:
+        # squaring is just spreading bits in characteristic 2,
+        # so the whole loop runs on packed ints
+        return pol.from_gf2_bits(gf2.frobenius_bits(n, pol.gf2_bits(f)))
+    if modulus is None:
+        modulus = pol.PolyModulus(f)
+    return FrobeniusPowers(modulus).power(n)
+
+# Frobenius powers
+# x -> x^p is a ring homomorphism of F_p[x]/(f), so
+#   x^(p^(a+b)) == x^(p^a) composed with x^(p^b)   (mod f)
+# which lets one modular composition stand in for b applications
+# of the Frobenius, each of which is a powering by p.
+# FrobeniusPowers keeps every x^(p^k) it has computed, and gets
+# new ones from the nearest cached one below, by plain Frobenius
+# steps when the gap is short and by a composition otherwise.
+# the compositions follow a doubling ladder x^(p^(2^j)),
+# so Rabin's test and distinct-degree factorization
+# share all their work through one cache.
+# a single Frobenius step g -> g^p is itself the composition g(x^p):
+# for large p that is cheaper than powering by p, and with the
+# baby steps of x^p kept in a CompositionTable it costs
+# about sqrt(n) multiplications, whatever the size of p.
+
+class FrobeniusPowers():
+    """
+    x^(p^k) mod f for any number of k, computed once each.
+    """
+    def __init__(self, modulus):
+        self.modulus = modulus
+        n = modulus.n
+        p = pol.FCH
+        # all costs counted in multiplications modulo f
+        powering_cost = p.bit_length() + bin(p).count("1") - 2
+        table_cost = isqrt(max(n - 1, 1)) + 1
+        self.step_cost = min(powering_cost, table_cost)
+        self.compose_cost = 2 * isqrt(max(n - 1, 1)) + 1
+        x = modulus.reduce(pol.monomial(deg=1))
+        # powering x by p is only squarings and shifts
+        self.cache = {0: x, 1: modulus.powmod(x, p)}
+        self.table = None
+        if table_cost < powering_cost:
+            self.table = pol.CompositionTable(self.cache[1], modulus)
+
+    def frobenius(self, g):
+        """
+        g^p mod f.
+        """
+        if self.table is not None:
+            return self.table.compose(g)
+        return self.modulus.powmod(g, pol.FCH)
+
+    def advance(self, g, k: int):
+        """
+        g^(p^k) mod f, i.e. k Frobenius steps applied to g.
+        """
+        if k * self.step_cost <= self.compose_cost:
+            for _ in range(k):
+                g = self.frobenius(g)
+            return g
+        # g(x)^(p^k) == g(x^(p^k))
+        return pol.compose_mod(g, self.power(k), self.modulus)
+
+    def power(self, k: int):
+        """
+        x^(p^k) mod f.
+        """
+        if k in self.cache:
+            return self.cache[k]
+        base = max(e for e in self.cache if e <= k)
+        gap = k - base
+        if (gap not in self.cache
+            and gap * self.step_cost > self.compose_cost):
+            # climb the ladder first, so the gap below is short
+            for j in range(1, k.bit_length()):
+                rung = 1 << j
+                if rung not in self.cache:
+                    half = self.power(rung // 2)
+                    self.cache[rung] = self.advance(half, rung // 2)
+            base = max(e for e in self.cache if e <= k)
+        result = self.advance(self.cache[base], k - base)
+        self.cache[k] = result
+        return result
 
 # this might be moved to auxiliaries
 # but so far is only used here
@@ -79,16 +174,161 @@ def p_root(poly):
                          f"of polynomial {str(poly)} -- "+
                          f"Not a perfect {powphrase}.")
     # now assemble the root's coeffs
-    # by just taking every p'th coeff
-    root_cfs = poly.coeffs[0::p]
+    # by just taking every p'th coeff (a view, not a copy)
+    root_cfs = poly.coeff_view(0, None, p)
     return pol.Poly(root_cfs)
 
+# root finding
+# the roots of f in F_p are the roots of g = gcd(f, x^p - x),
+# which is the product of (x - a) over the distinct roots a.
+# for odd p, every a != 0 is a root of either
+# x^((p-1)/2) - 1 or x^((p-1)/2) + 1, so gcd(g, (x+c)^((p-1)/2) - 1)
+# for random c splits g into two roughly equal parts.
+
+# in characteristics up to this, roots are found
+# by evaluating at every point of F_p in one multipoint pass
+ROOT_SCAN_LIMIT = 64
+
+def root_product(poly):
+    """
+    gcd(poly, x^p - x) for a polynomial of degree >= 2:
+    the product of (x - a) over all distinct roots a of poly.
+    """
+    x_p = xqpower(1, pol.PolyModulus(poly)) - pol.monomial(deg=1)
+    return pol.poly_gcd(poly, x_p)
+
+def _split_roots(g, roots: list):
+    # g is monic and a product of distinct linear factors
+    p = pol.FCH
+    if g.degree() == 1:
+        roots.append(-g.coeffs[0] % p)
+        return
+    modulus = pol.PolyModulus(g)
+    while True:
+        shift = pol.Poly([random.randrange(p), 1])
+        half = modulus.powmod(shift, (p - 1) // 2) - pol.constant(1)
+        part = pol.poly_gcd(g, half)
+        if 0 < part.degree() < g.degree():
+            break
+    _split_roots(part, roots)
+    _split_roots(g // part, roots)
+
+def find_roots(poly):
+    """
+    Sorted list of the distinct roots of `poly` in F_p.
+    """
+    p = pol.FCH
+    if poly.is_zero():
+        raise ValueError("Every point is a root of the zero polynomial!")
+    if poly.degree() == 0:
+        return []
+    if poly.degree() == 1:
+        return [-poly.coeffs[0] * pow(poly.coeffs[1], -1, p) % p]
+    if p <= ROOT_SCAN_LIMIT:
+        values = poly.peval_many(range(p))
+        return [point for point in range(p) if values[point] == 0]
+    g = root_product(poly)
+    roots = []
+    if g.degree() > 0:
+        _split_roots(g, roots)
+    return sorted(roots)
+
+# verdict cache
+# is_irreducible, is_primitive and factorize remember their results,
+# keyed on (kind, FCH, coefficient tuple), in one bounded cache
+# that evicts the least recently used entry when full.
+# a repeated query costs a tuple() of the coefficients
+# and a dict lookup. factorizations are handed out as copies,
+# since FactorList and Poly are mutable.
+# nothing display-dependent is cached: reasons keep their
+# polynomials as Polys and are formatted when read.
+# fileio can save the cache to saves/ and load it back.
+
+VERDICT_CACHE_SIZE = 4096
+
+class VerdictCache():
+    """
+    A least-recently-used cache of verdicts,
+    with hit and miss counters per kind.
+    Safe to share with the thread that feeds iter_batch's pool.
+    """
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.hits = {}
+        self.misses = {}
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, key):
+        """
+        The cached value for `key`, or None.
+        Counts a hit or a miss for the key's kind.
+        """
+        kind = key[0]
+        with self.lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                self.hits[kind] = self.hits.get(kind, 0) + 1
+                return self.entries[key]
+            self.misses[kind] = self.misses.get(kind, 0) + 1
+            return None
+
+    def put(self, key, value):
+        with self.lock:
+            self.entries[key] = value
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+
+    def clear(self):
+        """
+        Drops all entries and resets the counters.
+        """
+        with self.lock:
+            self.entries.clear()
+            self.hits.clear()
+            self.misses.clear()
+
+verdict_cache = VerdictCache(VERDICT_CACHE_SIZE)
+
+def _copy_verdict(value):
+    if isinstance(value, FactorList):
+        return FactorList([(f.__copy__(), m) for f, m in value.faclist],
+                          value.leadcoe)
+    if isinstance(value, IrredResult):
+        return IrredResult(value.verdict, value.template,
+                           *[f.__copy__() for f in value.polys])
+    return value
+
+def _cached_verdict(kind: str):
+    # decorator: looks the polynomial up in verdict_cache first
+    def decorate(func):
+        @wraps(func)
+        def wrapper(poly):
+            key = (kind, pol.FCH, tuple(poly.coeffs))
+            value = verdict_cache.get(key)
+            if value is None:
+                value = func(poly)
+                verdict_cache.put(key, value)
+            return _copy_verdict(value)
+        return wrapper
+    return decorate
+
 class IrredResult:
     # this class has one purpose and one purpose only:
     # to be a return type for the is_irreducible() function
-    def __init__(self, verdict: bool, reason: str):
+    # the reason is a template with one {} per polynomial in `polys`,
+    # filled in only when read, so that it follows the display options
+    def __init__(self, verdict: bool, template: str, *polys):
         self.verdict = verdict
-        self.reason = reason
+        self.template = template
+        self.polys = polys
+    @property
+    def reason(self):
+        return self.template.format(*map(str, self.polys))
     def __bool__(self):
         return self.verdict
     def verdict_stmt(self):
@@ -99,30 +339,9 @@ class IrredResult:
     def __str__(self):
         return f"{self.verdict_stmt()}.\nReason: {self.reason}"
 
-def is_irreducible(poly):
-    """
-    Checks polynomial `poly`, copied as `f`, for irreducibility.
-    Returns:
-    - True if the polynomial is irreducible, False otherwise.
-    - reason: the reason for (ir)reducibility; intended
-      for printing on the screen with `irred <poly> reason`.
-    """
-    
-    # Uses Rabin's test of irreducibility:
-    # Letting n = deg(f),
-    # p_0, ..., p_k be the prime factors of n,
-    # n_i = n // p_i,
-    # `f` is irreducible if and only if both of the following conditions
-    # are true:
-    # 1. gcd(f, x^(FCH^n_i) - x) = 1 for all i
-    # 2. f divides x^(FCH^n) - x
-    #
-    # implementation detail:
-    # since storing x^(q^n_i) - x and x^(q^n) - x directly would be
-    # prohibitively expensive due to their high degree,
-    # they are calculated modulo `f` via the helper function
-    # xqpower(n, f).
-    
+def _irreducible_edge_cases(poly):
+    # the checks both irreducibility tests start with;
+    # returns the verdict if one of them settles it, None otherwise
     reason = ""
     
     # get some edge cases out of the way first!
@@ -141,13 +360,8 @@ def is_irreducible(poly):
     # if it does, it's NOT irreducible
     # (since its degree is >= 2 if we made it this far)
     # output ALL roots for reason
-    roots = []
-    rootflag = False
-    for point in range(pol.FCH):
-        if poly.peval(point) == 0:
-            rootflag = True
-            roots.append(str(point))
-    if rootflag:
+    roots = [str(root) for root in find_roots(poly)]
+    if roots:
         if len(roots) == 1:
             reason = f"Has root {roots[0]}"
         else:
@@ -171,12 +385,42 @@ def is_irreducible(poly):
     # tested as computing GCD with its own derivative
     # if GCD isn't constant, f and f' have a common
     # factor, and thus f is NOT irreducible.
-    gcd, _, _ = pol.ext_euclid_algo(poly, poly.deriv())
+    gcd = pol.poly_gcd(poly, poly.deriv())
     if gcd.degree() > 0:
         if is_p_power(gcd):
             gcd = p_root(gcd)
-        reason = f"Repeated factor: {str(gcd)}"
-        return IrredResult(False, reason)
+        reason = "Repeated factor: {}"
+        return IrredResult(False, reason, gcd)
+    return None
+
+@_cached_verdict("irred")
+def is_irreducible(poly):
+    """
+    Checks polynomial `poly`, copied as `f`, for irreducibility.
+    Returns:
+    - True if the polynomial is irreducible, False otherwise.
+    - reason: the reason for (ir)reducibility; intended
+      for printing on the screen with `irred <poly> reason`.
+    """
+    
+    # Uses Rabin's test of irreducibility:
+    # Letting n = deg(f),
+    # p_0, ..., p_k be the prime factors of n,
+    # n_i = n // p_i,
+    # `f` is irreducible if and only if both of the following conditions
+    # are true:
+    # 1. gcd(f, x^(FCH^n_i) - x) = 1 for all i
+    # 2. f divides x^(FCH^n) - x
+    #
+    # implementation detail:
+    # since storing x^(q^n_i) - x and x^(q^n) - x directly would be
+    # prohibitively expensive due to their high degree,
+    # they are calculated modulo `f`, all of them
+    # through one FrobeniusPowers cache.
+    
+    result = _irreducible_edge_cases(poly)
+    if result is not None:
+        return result
 
     # and now time for Rabin's test!
 
@@ -185,6 +429,10 @@ def is_irreducible(poly):
     f = poly.monify()
     # get the degree as well
     n = f.degree()
+    # every reduction below is modulo f,
+    # and all the x^(FCH^k) come from one shared cache
+    modulus = pol.PolyModulus(f)
+    frobenius = FrobeniusPowers(modulus)
 
     # p_i and n_i (see comment on top)
     primes = aux.prime_factors(n)
@@ -196,28 +444,72 @@ def is_irreducible(poly):
     # if f fails to be coprime to one of them,
     # then f is NOT irreducible.
     for ni in prime_complements:
-        x_q_ni = xqpower(ni,f) - pol.monomial(deg=1)
-        gcd, _, _ = pol.ext_euclid_algo(x_q_ni, f)
+        x_q_ni = frobenius.power(ni) - pol.monomial(deg=1)
+        gcd = pol.poly_gcd(x_q_ni, f)
         if gcd.degree() > 0:
             reason = ("Rabin's test failed -- "+
                       f"not coprime to x^({pol.FCH}^{ni}) - x: "+
-                      f"gcd({f}, {x_q_ni}) = {gcd}")
-            return IrredResult(False, reason)
+                      "gcd({}, {}) = {}")
+            return IrredResult(False, reason, f, x_q_ni, gcd)
 
     # now f is coprime with x^(FCH^n_i) - x
     # if it DIVIDES x^(FCH^n) - x,
     # then it's irreducible.
     # otherwise it is not.
-    x_q_n = xqpower(n, f) - pol.monomial(deg=1)
+    x_q_n = frobenius.power(n) - pol.monomial(deg=1)
     # x_q_n is actually (x^(FCH^n_i) - x) % f
     # so f divides x^(FCH^n_i) - x
     # is equivalent to x_q_n == 0
-    if x_q_n.is_zero():
+    if not x_q_n.is_zero():
         reason = ("Rabin's test failed -- "+
                  f"Not a factor of x^({pol.FCH}^{n}) - x")
+        return IrredResult(False, reason)
     reason = "Rabin's test passed"
     return IrredResult(True, reason)
 
+# Ben-Or's test
+# a reducible f of degree n has an irreducible factor of some degree
+# i <= n/2, and then gcd(f, x^(p^i) - x) != 1.
+# so trying i = 1, 2, ... in turn, with one Frobenius step and one gcd
+# each, decides irreducibility, and stops at the smallest degree
+# of a factor. a random polynomial almost always has a factor of
+# small degree, so on random input this is much cheaper than Rabin's
+# test, which always goes all the way up to x^(p^n);
+# on irreducible input it's more expensive, n/2 gcds in all.
+
+def _ben_or_factor(f):
+    # for a monic f of degree >= 2, the smallest i <= n/2 with
+    # gcd(f, x^(p^i) - x) != 1 and that gcd, or None if there's none
+    modulus = pol.PolyModulus(f)
+    frobenius = FrobeniusPowers(modulus)
+    x = pol.monomial(deg=1)
+    for i in range(1, f.degree() // 2 + 1):
+        gcd = pol.poly_gcd(frobenius.power(i) - x, f)
+        if gcd.degree() > 0:
+            return i, gcd
+    return None
+
+@_cached_verdict("benor")
+def is_irreducible_ben_or(poly):
+    """
+    Checks `poly` for irreducibility, the same way as is_irreducible
+    except that Ben-Or's test replaces Rabin's.
+    """
+    result = _irreducible_edge_cases(poly)
+    if result is not None:
+        return result
+    found = _ben_or_factor(poly.monify())
+    if found is not None:
+        i, gcd = found
+        # the edge cases ruled out repeated factors, so the gcd is
+        # the product of all the irreducible factors of degree i
+        factors = aux.numphrase("factor", gcd.degree() // i)
+        reason = (f"Ben-Or's test failed -- {factors} of degree {i}, "+
+                  "with product {}")
+        return IrredResult(False, reason, gcd)
+    return IrredResult(True, "Ben-Or's test passed")
+
+@_cached_verdict("prim")
 def is_primitive(poly):
     """
     Checks whether a polynomial is primitive, as follows:
@@ -226,8 +518,10 @@ def is_primitive(poly):
        If it isn't, return False -- only irreducibles can be primitive.
     2. Reject primitivity for polynomials of degree <= 1:
        they do not generate field extensions.
-    3. For each proper divisor d of (p^n - 1), where p == pol.FCH
-       and n = poly.degree(), check whether x^n % poly == 1.
+    3. For each divisor d = (p^n - 1)/q, where p == pol.FCH,
+       n = poly.degree() and q runs over the primes dividing
+       p^n - 1, check whether x^d % poly == 1
+       (see the primitivity section below for how).
     4. If at least one of those IS 1, then the polynomial is
        not primitive -- its root has order d rather than p^n - 1,
        and so fails to generate GF(p^n)*.
@@ -244,29 +538,256 @@ def is_primitive(poly):
     if n <= 1:
         return False
 
+    return _x_has_full_order(poly.monify())
+
+# primitivity
+# for a primitive polynomial, we want the order of x modulo f
+# to be p^n - 1, i.e. x^((p^n - 1)/q) != 1 for every prime q | p^n - 1.
+# write p^n - 1 = (p - 1) r, with r = 1 + p + ... + p^(n-1).
+# x^r is the norm of x, which for monic f is the constant
+# (-1)^n f(0), so for the primes q | p - 1 the check is
+#   ((-1)^n f(0))^((p - 1)/q) != 1 in F_p
+# with no polynomial arithmetic at all.
+# every other prime q divides r, and x^((p^n - 1)/q) = y^(r/q)
+# for y = x^(p - 1); these all come off one shared ladder:
+# split the primes into halves A and B, raise to the product of B
+# to serve A and to the product of A to serve B, and recurse.
+# that's O(log k) full-size powerings for k primes instead of k.
+# the factorization of p^n - 1 itself is done once per (p, n),
+# piece by piece over the cyclotomic values Phi_d(p), d | n,
+# and cached.
+
+_order_factor_cache = {}
+
+def _divisors(n: int):
+    # all divisors of n, 1 and n included, sorted
+    return [1] + aux.proper_factors(n) + ([n] if n > 1 else [])
+
+def _cyclotomic_value(d: int, p: int):
+    # Phi_d(p) = product over e | d of (p^e - 1)^mu(d/e)
+    num = 1
+    den = 1
+    for e in _divisors(d):
+        mu = aux.mobius(d // e)
+        if mu == 1:
+            num *= p ** e - 1
+        elif mu == -1:
+            den *= p ** e - 1
+    return num // den
+
+def order_prime_factors(n: int):
+    """
+    The primes dividing p^n - 1, p = pol.FCH, as a pair of
+    sorted lists: those dividing p - 1, and all the others.
+    Computed once per (p, n).
+    """
+    p = pol.FCH
+    key = (p, n)
+    if key not in _order_factor_cache:
+        primes = set()
+        for d in _divisors(n):
+            primes.update(aux.prime_factors(_cyclotomic_value(d, p)))
+        base = sorted(q for q in primes if (p - 1) % q == 0)
+        rest = sorted(q for q in primes if (p - 1) % q != 0)
+        _order_factor_cache[key] = (base, rest)
+    return _order_factor_cache[key]
+
+def _all_nontrivial(base, primes: list, modulus):
+    # True if base^(P/q) != 1 for every q in primes,
+    # P being their product
+    if len(primes) == 1:
+        return base != pol.constant(1)
+    half = len(primes) // 2
+    left, right = primes[:half], primes[half:]
+    left_prod = 1
+    for q in left:
+        left_prod *= q
+    right_prod = 1
+    for q in right:
+        right_prod *= q
+    return (_all_nontrivial(modulus.powmod(base, right_prod), left, modulus)
+            and _all_nontrivial(modulus.powmod(base, left_prod), right,
+                                modulus))
+
+def _x_has_full_order(f):
+    # whether x has order p^n - 1 modulo a monic irreducible f
+    # of degree n >= 2, as described above
     p = pol.FCH
-    fieldsize = p ** n - 1
-    # only need to check divisors of the form
-    # (p^n - 1)/prime
-    divs = [fieldsize // p_ for p_ in aux.prime_factors(fieldsize)]
-
-    # edge case: if p^n - 1 is prime, primitivity is guaranteed
-    # can happen if p=2, i.e. if p^n - 1 is a Mersenne prime
-    if aux.is_prime(p ** n - 1):
+    n = f.degree()
+    rest = order_prime_factors(n)[1]
+    if not _primitive_constant(f.coeffs[0], n):
+        return False
+    if not rest:
         return True
+    modulus = pol.PolyModulus(f)
+    y = modulus.powmod(pol.monomial(deg=1), p - 1)
+    r = (p ** n - 1) // (p - 1)
+    product = 1
+    for q in rest:
+        product *= q
+    return _all_nontrivial(modulus.powmod(y, r // product), rest, modulus)
 
-    # for a primitive polynomial, we want the
-    # order of x modulo poly to be p^n - 1
-    # so if x^d % poly = 1 for any proper divisor d of p^n - 1
-    # we know it isn't
-    for d in divs:
-        if pol.x_power_modulo(d, poly) == pol.constant(1):
-            return False
-    # and if we made it through the loop, we know
-    # that the order of x modulo poly is
-    # NOT any proper divisor of p^n - 1
-    # therefore the polynomial is indeed primitive
-    return True
+def _primitive_constant(c: int, n: int):
+    # whether (-1)^n c is a primitive root mod p, i.e. whether
+    # a monic primitive polynomial of degree n can have constant term c
+    p = pol.FCH
+    norm = (-1) ** n * c % p
+    if norm == 0:
+        return False
+    return all(pow(norm, (p - 1) // q, p) != 1
+               for q in order_prime_factors(n)[0])
+
+# enumerating irreducibles and primitives
+# the monic polynomials of degree n are numbered 0..p^n - 1
+# by reading their lower n coefficients as base-p digits,
+# constant term first, and are generated in that order.
+# when there are few enough of them (SIEVE_LIMIT), every product
+# of a lower-degree irreducible g with a monic cofactor is struck
+# off a table, the way the sieve of Eratosthenes strikes multiples;
+# what is left is irreducible.
+# above that, candidates are streamed one at a time, and each goes
+# through Ben-Or's test, which gives up on most of them early.
+# the expected counts come from Gauss's formula
+#   (1/n) * sum over d | n of mu(d) p^(n/d)
+# and, for primitives, phi(p^n - 1)/n.
+
+SIEVE_LIMIT = 2 ** 16
+
+def count_irreducibles(n: int):
+    """
+    Number of monic irreducible polynomials of degree n,
+    by Gauss's formula.
+    """
+    if n <= 0:
+        return 0
+    p = pol.FCH
+    return sum(aux.mobius(d) * p ** (n // d) for d in _divisors(n)) // n
+
+def count_primitives(n: int):
+    """
+    Number of monic primitive polynomials of degree n.
+    Degree 1 and under gives 0, as with is_primitive.
+    """
+    if n <= 1:
+        return 0
+    # p^n - 1 is factored once per session, by numtheory
+    return aux.euler_phi(pol.FCH ** n - 1) // n
+
+def _monic_from_index(index: int, n: int):
+    # the monic polynomial of degree n numbered `index`
+    p = pol.FCH
+    cfs = []
+    for _ in range(n):
+        index, c = divmod(index, p)
+        cfs.append(c)
+    cfs.append(1)
+    return pol.Poly(cfs)
+
+def _sieve_irreducibles(n: int):
+    p = pol.FCH
+    powers = [p ** i for i in range(n)]
+    reducible = bytearray(p ** n)
+    for d in range(1, n // 2 + 1):
+        for g in iter_irreducibles(d):
+            g_cfs = list(g.coeffs)
+            # walk through g * h for every monic h of degree n - d,
+            # counting the lower part of h up in base p:
+            # adding 1 to its i'th digit adds g * x^i to the product
+            prod = [0] * (n - d) + g_cfs[:d]
+            index = sum(c * pw for c, pw in zip(prod, powers))
+            digits = [0] * (n - d)
+            while True:
+                reducible[index] = 1
+                i = 0
+                while i < n - d:
+                    for j, c in enumerate(g_cfs):
+                        old = prod[i + j]
+                        new = (old + c) % p
+                        prod[i + j] = new
+                        index += (new - old) * powers[i + j]
+                    if digits[i] < p - 1:
+                        digits[i] += 1
+                        break
+                    # the digit wraps around to 0: p copies of g * x^i
+                    # have been added, which is nothing, so carry on
+                    digits[i] = 0
+                    i += 1
+                if i == n - d:
+                    break
+    for index in range(p ** n):
+        if not reducible[index]:
+            yield _monic_from_index(index, n)
+
+def _passes_ben_or(f):
+    # irreducibility of a monic candidate of degree >= 2
+    return _ben_or_factor(f) is None
+
+def iter_irreducibles(n: int):
+    """
+    Generates every monic irreducible polynomial of degree n,
+    in the order described above. Expect count_irreducibles(n)
+    of them.
+    """
+    p = pol.FCH
+    if n <= 0:
+        return
+    if n == 1:
+        for a in range(p):
+            yield pol.Poly([a, 1])
+        return
+    if p ** n <= SIEVE_LIMIT:
+        yield from _sieve_irreducibles(n)
+        return
+    # index p^k is x^k, so starting at 1 skips
+    # the multiples of x, i.e. zero constant terms
+    for index in range(1, p ** n):
+        if index % p == 0:
+            continue
+        f = _monic_from_index(index, n)
+        if _passes_ben_or(f):
+            yield f
+
+def iter_primitives(n: int):
+    """
+    Generates every monic primitive polynomial of degree n,
+    in the same order as iter_irreducibles.
+    Expect count_primitives(n) of them.
+    """
+    if n <= 1:
+        return
+    for f in iter_irreducibles(n):
+        if _x_has_full_order(f):
+            yield f
+
+def find_primitive(n: int, method: str = "random"):
+    """
+    Finds a monic primitive polynomial of degree n >= 2.
+    `method` is "random", for a uniformly random one,
+    or "lexfirst", for the first one in the order
+    iter_primitives generates them in.
+    """
+    if n <= 1:
+        raise ValueError("Primitive polynomials have degree 2 or more.")
+    if method not in ["random", "lexfirst"]:
+        raise ValueError(f"Unknown search method '{method}'!")
+    p = pol.FCH
+    if method == "random":
+        while True:
+            c = random.randrange(1, p)
+            if not _primitive_constant(c, n):
+                continue
+            f = pol.Poly([c] + [random.randrange(p) for _ in range(n - 1)]
+                         + [1])
+            if _passes_ben_or(f) and _x_has_full_order(f):
+                return f
+    # index order, skipping the constant terms no primitive can have
+    for high in range(p ** (n - 1)):
+        for c in range(1, p):
+            if not _primitive_constant(c, n):
+                continue
+            f = _monic_from_index(high * p + c, n)
+            if _passes_ben_or(f) and _x_has_full_order(f):
+                return f
 
 class FactorList:
     """
@@ -414,10 +935,223 @@ class FactorList:
             prodlist.append(newtup)
         return FactorList(prodlist, prodlcf)
 
-# UNFINISHED
+# factorization
+# done in three stages, as usual over finite fields:
+# 1. square-free decomposition: f = product of g_m^m,
+#    with every g_m square-free and coprime to the others
+# 2. distinct-degree factorization: each g_m is split into
+#    products of irreducibles that all share one degree d,
+#    using gcd(g, x^(p^d) - x)
+# 3. equal-degree factorization (Cantor-Zassenhaus):
+#    products of degree-d irreducibles are split by gcds
+#    with random elements raised to (p^d - 1)/2
+#    (or put through the trace map in characteristic 2)
+
+def square_free_decomposition(f):
+    """
+    For a monic non-constant polynomial f, returns a list of pairs
+    (g, m) such that f is the product of the g^m,
+    every g is square-free and monic, and the g are pairwise coprime.
+    """
+    p = pol.FCH
+    result = []
+    # c collects the repeated part, w the factors not yet written out
+    c = pol.poly_gcd(f, f.deriv())
+    w = f // c
+    mult = 1
+    while w.degree() > 0:
+        # the factors of w still present in c occur
+        # more than `mult` times; the rest occur exactly `mult` times
+        y = pol.poly_gcd(w, c)
+        factor = w // y
+        if factor.degree() > 0:
+            result.append((factor, mult))
+        w = y
+        c = c // y
+        mult += 1
+    # what's left has zero derivative: a p'th power
+    if c.degree() > 0:
+        for g, m in square_free_decomposition(p_root(c)):
+            result.append((g, m * p))
+    return result
+
+def distinct_degree_factorization(f):
+    """
+    For a monic square-free polynomial f, returns a list of pairs
+    (g, d) such that f is the product of the g,
+    and every g is the product of all irreducible factors
+    of f of degree d.
+    """
+    # Kaltofen-Shoup baby steps and giant steps:
+    # with l about sqrt(n/2), the baby steps are x^(p^i) for i < l
+    # and the giant steps x^(p^(lj)). the product over i of
+    # (x^(p^(lj)) - x^(p^i)) is divisible by all irreducibles
+    # whose degree divides some lj - i, so one gcd per giant step
+    # finds every factor with degree in (l(j-1), lj].
+    # everything stays modulo the original f, which the
+    # remaining part of f always divides.
+    result = []
+    n = f.degree()
+    if n < 2:
+        if n == 1:
+            result.append((f, 1))
+        return result
+    modulus = pol.PolyModulus(f)
+    frobenius = FrobeniusPowers(modulus)
+    l = max(isqrt(n // 2), 1)
+    baby = [frobenius.power(i) for i in range(l)]
+    j = 0
+    while f.degree() >= 2 * (l * j + 1):
+        j += 1
+        giant = frobenius.power(l * j)
+        interval = pol.constant(1)
+        for b in baby:
+            interval = modulus.mulmod(interval, giant - b)
+        g = pol.poly_gcd(f, interval)
+        if g.degree() == 0:
+            continue
+        f = f // g
+        # sort out the degrees in the interval, lowest first,
+        # so g only ever holds factors of the current degree or higher
+        for i in range(l - 1, -1, -1):
+            h = pol.poly_gcd(g, giant - baby[i])
+            if h.degree() > 0:
+                result.append((h, l * j - i))
+                g = g // h
+            if g.degree() == 0:
+                break
+    # anything left over can't split further
+    if f.degree() > 0:
+        result.append((f, f.degree()))
+    return result
+
+def _random_poly(degree: int):
+    # uniformly random polynomial of degree below `degree`
+    return pol.Poly([random.randrange(pol.FCH) for _ in range(degree)])
+
+def equal_degree_factorization(f, d: int):
+    """
+    For a monic square-free polynomial f whose irreducible factors
+    all have degree d, returns the list of those factors, sorted.
+    """
+    factors = []
+    _split_equal_degree(f, d, factors)
+    return sorted(factors)
+
+def _split_equal_degree(f, d: int, factors: list):
+    p = pol.FCH
+    n = f.degree()
+    if n == d:
+        factors.append(f)
+        return
+    modulus = pol.PolyModulus(f)
+    while True:
+        a = modulus.reduce(_random_poly(n))
+        if p == 2:
+            # trace of a from GF(2^d) down to GF(2):
+            # a + a^2 + a^4 + ... + a^(2^(d-1)),
+            # which is 0 or 1 modulo each factor
+            trace = a
+            for _ in range(d - 1):
+                a = modulus.sqrmod(a)
+                trace = trace + a
+            b = trace
+        else:
+            # a^((p^d - 1)/2) is +1 or -1 modulo each factor
+            # not dividing a, each about half the time
+            b = modulus.powmod(a, (p ** d - 1) // 2) - pol.constant(1)
+        g = pol.poly_gcd(f, b)
+        if 0 < g.degree() < n:
+            break
+    _split_equal_degree(g, d, factors)
+    _split_equal_degree(f // g, d, factors)
+
+# Berlekamp's algorithm
+# for square-free f of degree n, the polynomials g of degree < n
+# with g^p == g (mod f) form a vector space over F_p whose dimension
+# is the number of irreducible factors of f.
+# since g^p = sum of g_i x^(pi), that space is the set of
+# coefficient vectors v with v Q == v, where row i of the
+# matrix Q holds the coefficients of x^(pi) mod f.
+# every such g is constant modulo each irreducible factor,
+# so gcd(f, g - s) over s in F_p splits f deterministically.
+# the gcds cost p each, hence small characteristics only.
+
+# factorize uses Berlekamp for square-free parts with
+# 2 < p <= BERLEKAMP_MAX_CHAR and degree <= BERLEKAMP_MAX_DEGREE,
+# and distinct/equal-degree factorization otherwise.
+# past that degree the cubic row reduction loses to the
+# randomized method, and in characteristic 2 the bit-packed
+# Frobenius makes the randomized method faster at every size
+# (see `python benchmarks.py factor` for the crossover)
+BERLEKAMP_MAX_CHAR = 7
+BERLEKAMP_MAX_DEGREE = 32
+
+def berlekamp_matrix(f):
+    """
+    The n x n matrix Q of Berlekamp's algorithm for f of degree n:
+    row i holds the coefficients of x^(p*i) mod f.
+    """
+    n = f.degree()
+    modulus = pol.PolyModulus(f)
+    x_p = modulus.powmod(pol.monomial(deg=1), pol.FCH)
+    rows = []
+    power = pol.constant(1)
+    for i in range(n):
+        cfs = list(power.coeffs)
+        rows.append(cfs + [0] * (n - len(cfs)))
+        power = modulus.mulmod(power, x_p)
+    return rows
+
+def berlekamp_basis(f):
+    """
+    Basis of the Berlekamp subalgebra of f, as polynomials:
+    the null space of (Q - I) acting on row vectors.
+    """
+    p = pol.FCH
+    q_matrix = berlekamp_matrix(f)
+    for i in range(len(q_matrix)):
+        q_matrix[i][i] -= 1
+    # v (Q - I) == 0  <=>  (Q - I)^T v == 0
+    transposed = [list(col) for col in zip(*q_matrix)]
+    return [pol.Poly(v) for v in fplinalg.nullspace(transposed, p)]
+
+def berlekamp_factorization(f):
+    """
+    For a monic square-free polynomial f, returns the sorted list
+    of its monic irreducible factors, by Berlekamp's algorithm.
+    """
+    basis = berlekamp_basis(f)
+    count = len(basis)
+    factors = [f]
+    for g in basis:
+        if len(factors) == count:
+            break
+        # the constants are always in the subalgebra and split nothing
+        if g.degree() <= 0:
+            continue
+        refined = []
+        for h in factors:
+            if h.degree() == 1:
+                refined.append(h)
+                continue
+            # g - s for different s are coprime,
+            # so the nontrivial gcds multiply up to h
+            g_mod_h = g % h if g.degree() >= h.degree() else g
+            for s in range(pol.FCH):
+                d = pol.poly_gcd(h, g_mod_h - pol.constant(s))
+                if d.degree() > 0:
+                    refined.append(d)
+                    if d.degree() == h.degree():
+                        break
+        factors = refined
+    return sorted(factors)
+
+@_cached_verdict("factor")
 def factorize(poly) -> FactorList:
     """
-    Factorizes the given polynomial.
+    Factorizes the given polynomial into monic irreducibles,
+    recording the leading coefficient separately.
     """
     # edge cases out of the way first
 
@@ -437,22 +1171,92 @@ def factorize(poly) -> FactorList:
     if f.degree() == 0:
         return FactorList([], lead_coeff)
 
-    # if poly is irreducible, it has one factor: itself
-    # this also handles linears
-    if is_irreducible(f):
-        return FactorList([(f, 1)], lead_coeff)
-
-    # initialize factor list as empty
-    factors = FactorList([], lead_coeff)
-
-    # extract all linear factors
-    for i in range(pol.FCH):
-        while f.peval(i) == 0:
-            lin = pol.Poly([-i, 1])
-            factors.append(lin)
-            f = f // lin
-
-    ### UNFINISHED!
-    # struggling a bit with how to implement the full thing at the moment
-    factors.append(f)
-    return factors
+    faclist = []
+    for sqfree, mult in square_free_decomposition(f):
+        if (2 < pol.FCH <= BERLEKAMP_MAX_CHAR
+            and sqfree.degree() <= BERLEKAMP_MAX_DEGREE):
+            for factor in berlekamp_factorization(sqfree):
+                faclist.append((factor, mult))
+            continue
+        for g, d in distinct_degree_factorization(sqfree):
+            for factor in equal_degree_factorization(g, d):
+                faclist.append((factor, mult))
+    return FactorList(faclist, lead_coeff)
+
+# batch testing
+# runs is_irreducible or is_primitive over many polynomials
+# on a multiprocessing pool. the workers get the characteristic once,
+# when they start, and then only coefficient tuples; polynomials
+# already in verdict_cache are answered from it and never sent.
+# results come back in submission order and go into verdict_cache
+# on the way.
+# the input may be any iterable, including an endless candidate
+# generator: it's consumed lazily, a chunk at a time.
+
+# polynomials per message to a worker
+BATCH_CHUNK = 16
+
+def _batch_init(fch: int):
+    pol.FCH = fch
+
+def _batch_irred(coeffs: tuple):
+    return is_irreducible(pol.Poly(list(coeffs)))
+
+def _batch_prim(coeffs: tuple):
+    return is_primitive(pol.Poly(list(coeffs)))
+
+_batch_jobs = {"irred": _batch_irred, "prim": _batch_prim}
+
+def iter_batch(kind: str, polys, processes: int = None):
+    """
+    Yields the "irred" (IrredResult) or "prim" (bool) verdict
+    for every polynomial in `polys`, in order.
+    Uses `processes` worker processes, by default one per CPU;
+    with a single one, everything runs in this process.
+    """
+    job = _batch_jobs[kind]
+    if processes is None:
+        processes = os.cpu_count() or 1
+    if processes <= 1:
+        for poly in polys:
+            yield job(tuple(poly.coeffs))
+        return
+    fch = pol.FCH
+    # (key, cached verdict or None) for every polynomial, in order,
+    # not yet yielded; pool.imap runs submit() in a thread of its own
+    pending = deque()
+
+    def submit():
+        for poly in polys:
+            key = (kind, fch, tuple(poly.coeffs))
+            value = verdict_cache.get(key)
+            pending.append((key, value))
+            if value is None:
+                yield key[2]
+
+    def cached():
+        # the cache hits queued up in front of the next miss
+        while pending and pending[0][1] is not None:
+            yield _copy_verdict(pending.popleft()[1])
+
+    with multiprocessing.Pool(processes, initializer=_batch_init,
+                              initargs=(fch,)) as pool:
+        for result in pool.imap(job, submit(), BATCH_CHUNK):
+            yield from cached()
+            verdict_cache.put(pending.popleft()[0], result)
+            yield _copy_verdict(result)
+        yield from cached()
+
+def batch_is_irreducible(polys, processes: int = None):
+    """
+    is_irreducible for every polynomial in `polys`, in parallel.
+    Returns the list of IrredResults, in order.
+    """
+    return list(iter_batch("irred", polys, processes))
+
+def batch_is_primitive(polys, processes: int = None):
+    """
+    is_primitive for every polynomial in `polys`, in parallel.
+    Returns the list of verdicts, in order.
+    """
+    return list(iter_batch("prim", polys, processes))